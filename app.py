@@ -1,12 +1,10 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import pickle
-from src.Job_Matcher_06 import get_top_matches
-from src.Resume_Parser_07 import parse_resume
 import tempfile
 import os
 
+# Heavy modules (NumPy model bundle, spaCy parser, matcher, neighbors index) are
+# imported on the code path that needs them so a cold start only pays for Streamlit
+
 
 # Page configuration
 st.set_page_config(
@@ -101,21 +99,38 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-# Load model and scaler
+# Load model bundle (scaler + model, validated against the manifest) on first prediction
 @st.cache_resource
 def load_models():
+    from src.Model_Artifacts_12 import load_bundle, BundleError
     try:
-        with open('Models/Best_Placement_Model.pkl', 'rb') as f:
-            model = pickle.load(f)
-        with open('Models/Final_Scaler.pkl', 'rb') as f:
-            scaler = pickle.load(f)
-        return model, scaler
-    except FileNotFoundError:
-        st.error("⚠️ Model files not found!")
+        return load_bundle()
+    except BundleError as e:
+        st.error(f"⚠️ Model bundle could not be loaded: {e}")
         st.stop()
 
 
-model, scaler = load_models()
+@st.cache_resource
+def load_similar_students():
+    from src.Similar_Students_18 import load_or_build
+    return load_or_build()
+
+
+# Parse each distinct upload once; reruns of the script reuse the result
+@st.cache_data(show_spinner=False)
+def parse_uploaded_resume(pdf_bytes):
+    from src.Resume_Parser_07 import parse_resume
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
+        tmp_file.write(pdf_bytes)
+        tmp_path = tmp_file.name
+    try:
+        return parse_resume(tmp_path)
+    finally:
+        # Clean up temp file
+        try:
+            os.unlink(tmp_path)
+        except:
+            pass
 
 
 # Header
@@ -174,6 +189,7 @@ innovative_project = "No"
 technical_course = "No"
 comm_level = 3
 tech_skills = 40
+skills = ['Python', 'Java', 'DSA', 'SQL', 'React']
 
 
 # Resume Upload Section
@@ -182,15 +198,10 @@ if input_method == "📤 Upload Resume (NLP)":
     uploaded_file = st.file_uploader("Choose PDF resume", type=['pdf'], help="Upload your resume in PDF format")
     
     if uploaded_file is not None:
-        # Save temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-            tmp_file.write(uploaded_file.read())
-            tmp_path = tmp_file.name
-        
         # Parse resume
         with st.spinner("🔍 Parsing your resume with NLP..."):
             try:
-                parsed_data = parse_resume(tmp_path)
+                parsed_data = parse_uploaded_resume(uploaded_file.getvalue())
                 
                 if parsed_data:
                     st.success("✅ Resume parsed successfully!")
@@ -205,6 +216,7 @@ if input_method == "📤 Upload Resume (NLP)":
                     technical_course = "Yes" if parsed_data['technical_course'] else "No"
                     comm_level = parsed_data['communication_level']
                     tech_skills = parsed_data['technical_skills_score']
+                    skills = parsed_data['skills']
                     
                     # Display extracted info
                     st.markdown("### 📊 Extracted Information")
@@ -232,12 +244,6 @@ if input_method == "📤 Upload Resume (NLP)":
             except Exception as e:
                 st.error(f"❌ Error: {str(e)}")
                 st.info("💡 Try manual entry instead")
-            finally:
-                # Clean up temp file
-                try:
-                    os.unlink(tmp_path)
-                except:
-                    pass
 
 
 st.markdown("---")
@@ -286,27 +292,32 @@ with col2:
     predict_clicked = st.button("🚀 PREDICT MY PLACEMENT", use_container_width=True)
     
     if predict_clicked:
-        # Prepare input
-        input_data = pd.DataFrame({
-            '10th marks': [marks_10],
-            '12th marks': [marks_12],
-            'Cgpa': [cgpa],
-            'Internships(Y/N)': [1 if internships == "Yes" else 0],
-            'Training(Y/N)': [1 if training == "Yes" else 0],
-            'Innovative Project(Y/N)': [1 if innovative_project == "Yes" else 0],
-            'Communication level': [comm_level],
-            'Technical Course(Y/N)': [1 if technical_course == "Yes" else 0],
-            'Technical_Skills_Score': [tech_skills]
-        })
+        from src.Job_Matcher_06 import get_top_matches
+        from src.What_If_17 import what_if, next_tier_changes
         
-        # Predict
-        input_scaled = scaler.transform(input_data)
-        prediction = model.predict(input_scaled)[0]
-        prediction_proba = model.predict_proba(input_scaled)[0]
+        predictor = load_models()
+        
+        # Prepare input (one row keyed by model feature name)
+        input_data = {
+            '10th marks': marks_10,
+            '12th marks': marks_12,
+            'Cgpa': cgpa,
+            'Internships(Y/N)': 1 if internships == "Yes" else 0,
+            'Training(Y/N)': 1 if training == "Yes" else 0,
+            'Innovative Project(Y/N)': 1 if innovative_project == "Yes" else 0,
+            'Communication level': comm_level,
+            'Technical Course(Y/N)': 1 if technical_course == "Yes" else 0,
+            'Technical_Skills_Score': tech_skills
+        }
+        
+        # Predict (feature contributions come from the same pass when the model supports them)
+        explained = predictor.predict_with_explanations(input_data) if predictor.can_explain else None
+        prediction_proba = explained['probabilities'][0] if explained else predictor.predict_proba(input_data)[0]
+        prediction = predictor.classes[prediction_proba.argmax()]
         
         # Map classes
-        class_map = {0: 'Basic', 1: 'Not Placed', 2: 'Premium', 3: 'Standard'}
-        predicted_class = class_map[prediction]
+        class_map = predictor.class_map
+        predicted_class = class_map[int(prediction)]
         emoji_map = {'Basic': '🔵', 'Standard': '🟢', 'Premium': '🟡', 'Not Placed': '🔴'}
         
         # Result
@@ -328,6 +339,48 @@ with col2:
             with col_metric2:
                 st.markdown(f"<h3 style='color: #667eea; margin: 0;'>{confidence:.1f}%</h3>", unsafe_allow_html=True)
         
+        # Which inputs pushed the prediction towards / away from this tier
+        if explained:
+            with st.expander("🧠 Why this prediction?"):
+                for feature, contribution in predictor.top_contributions(explained['contributions'][0], top_k=5):
+                    direction = "⬆️ pushes towards" if contribution > 0 else "⬇️ pulls away from"
+                    st.markdown(f"- **{feature}** {direction} {predicted_class} ({contribution:+.2f})")
+                if predictor.explanation_units == 'probability':
+                    st.caption("Change in predicted probability along the model's decision path")
+                else:
+                    st.caption("Impact on the model score (log-odds) relative to an average student")
+        
+        # What-if: smallest CGPA / skills / certification gains that reach a higher tier (never lowers an input)
+        if predicted_class != 'Premium':
+            with st.expander("🔮 What would move me up?"):
+                what_if_result = what_if(
+                    input_data,
+                    {
+                        'Cgpa': (cgpa, 10.0, 0.1),
+                        'Technical_Skills_Score': (tech_skills, 100, 5),
+                        'Internships(Y/N)': [input_data['Internships(Y/N)'], 1],
+                        'Technical Course(Y/N)': [input_data['Technical Course(Y/N)'], 1],
+                    },
+                    predictor,
+                )
+                for tier, change in next_tier_changes(what_if_result).items():
+                    if change is None:
+                        st.markdown(f"- {emoji_map[tier]} **{tier}**: not reachable with these changes alone")
+                    else:
+                        steps = ', '.join(f"{f}: {c['from']:g} → {c['to']:g}" for f, c in change['changes'].items())
+                        st.markdown(f"- {emoji_map[tier]} **{tier}**: {steps}")
+        
+        # Nearest past students and their real outcomes
+        with st.expander("🎓 Students Like You"):
+            neighbors = load_similar_students().similar_students(input_data, k=5)
+            st.dataframe([{
+                'CGPA': n['Cgpa'],
+                'Tech Skills': n['Technical_Skills_Score'],
+                'Internship': 'Yes' if n['Internships(Y/N)'] else 'No',
+                'Outcome': f"{emoji_map[n['package_category']]} {n['package_category']}",
+                'Salary (LPA)': n['salary'],
+            } for n in neighbors], hide_index=True, use_container_width=True)
+        
         st.markdown("---")
         
         # Job Matching
@@ -338,7 +391,7 @@ with col2:
             'cgpa': cgpa,
             'tenth_marks': marks_10,
             'twelfth_marks': marks_12,
-            'skills': ['Python', 'Java', 'DSA', 'SQL', 'React'],
+            'skills': skills,
             'internships': 1 if internships == "Yes" else 0,
             'projects': 1 if innovative_project == "Yes" else 0,
             'training': 1 if training == "Yes" else 0,
@@ -0,0 +1,134 @@
+"""
+Import-Time Benchmark
+Imports each startup-path module in a fresh interpreter with `-X importtime`
+and checks it against a time budget and a list of heavy packages it must not
+pull in (spaCy, pandas, scikit-learn, ...). Exits non-zero on any violation
+
+Usage: python benchmarks/bench_import_time.py [--repeat 5] [--output import_report.json]
+"""
+
+import re
+import sys
+import json
+import argparse
+import subprocess
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# module -> (cumulative import budget in ms, packages that must stay unloaded)
+BUDGETS = {
+    'src.Records_09': (25, ['numpy', 'pandas', 'spacy']),
+    'src.Resume_Parser_07': (40, ['spacy', 'PyPDF2', 'pdfplumber', 'numpy', 'pandas']),
+    'src.Match_Scoring_19': (250, ['pandas', 'sklearn']),
+    'src.Job_Matcher_06': (250, ['pandas', 'sklearn', 'spacy']),
+    'src.Model_Artifacts_12': (250, ['pandas', 'sklearn', 'joblib']),
+    'src.What_If_17': (250, ['pandas', 'sklearn', 'spacy']),
+}
+
+# Reported but not budgeted: the app's own startup cost is dominated by Streamlit
+OPTIONAL_MODULES = ['streamlit']
+
+_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def import_profile(module):
+    """
+    Import a module in a fresh interpreter (module=None imports nothing)
+    Returns (cumulative ms of the module, {loaded module: cumulative ms})
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}' if module else 'pass'],
+        cwd=REPO_ROOT, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise ImportError(result.stderr.strip().splitlines()[-1])
+
+    loaded = {}
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            loaded[match.group(4)] = int(match.group(2)) / 1000
+    return loaded.get(module, 0.0), loaded
+
+
+def benchmark(module, repeat=3, startup=()):
+    """
+    Best-of-repeat cumulative import time plus the heaviest packages it pulls in
+    startup: modules the bare interpreter already loads, excluded from the breakdown
+    """
+    runs = [import_profile(module) for _ in range(repeat)]
+    total_ms, loaded = min(runs, key=lambda run: run[0])
+    top_level = {name: ms for name, ms in loaded.items()
+                 if '.' not in name and name != module and name not in startup}
+    heaviest = sorted(top_level.items(), key=lambda item: item[1], reverse=True)[:5]
+    return {
+        'module': module,
+        'import_ms': round(total_ms, 1),
+        'modules_loaded': len(loaded),
+        'heaviest': [{'package': name, 'ms': round(ms, 1)} for name, ms in heaviest],
+        'loaded': loaded,
+    }
+
+
+def check(report, budget_ms, forbidden):
+    """List of budget / forbidden-import violations for one module report"""
+    problems = []
+    if report['import_ms'] > budget_ms:
+        problems.append(f"{report['import_ms']} ms > {budget_ms} ms budget")
+    for package in forbidden:
+        if package in report['loaded']:
+            problems.append(f"imports {package}")
+    return problems
+
+
+# Command line entry point
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check startup import time of the app's modules")
+    parser.add_argument('--repeat', type=int, default=3, help="Fresh interpreters per module (best time is kept)")
+    parser.add_argument('--output', help="Write the import-time report as JSON")
+    args = parser.parse_args()
+
+    print("⏱️  IMPORT-TIME REPORT")
+    print("=" * 70)
+    startup = set(import_profile(None)[1])
+    reports, failures = [], 0
+    for module, (budget_ms, forbidden) in BUDGETS.items():
+        try:
+            report = benchmark(module, args.repeat, startup)
+        except ImportError as e:
+            print(f"❌ {module:<24} import failed: {e}")
+            failures += 1
+            continue
+        problems = check(report, budget_ms, forbidden)
+        report['budget_ms'] = budget_ms
+        report['problems'] = problems
+        failures += bool(problems)
+
+        status = '❌' if problems else '✅'
+        heaviest = ', '.join(f"{h['package']} {h['ms']:.0f}" for h in report['heaviest'][:3])
+        print(f"{status} {module:<24} {report['import_ms']:>7.1f} ms (budget {budget_ms}) | {heaviest or '-'}")
+        for problem in problems:
+            print(f"      ⚠️  {problem}")
+        reports.append(report)
+
+    for module in OPTIONAL_MODULES:
+        try:
+            report = benchmark(module, args.repeat, startup)
+        except ImportError:
+            print(f"➖ {module:<24} not installed")
+            continue
+        print(f"ℹ️  {module:<24} {report['import_ms']:>7.1f} ms (not budgeted)")
+        reports.append(report)
+
+    print("=" * 70)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump([{k: v for k, v in r.items() if k != 'loaded'} for r in reports], f, indent=2)
+        print(f"💾 Report written to {args.output}")
+
+    if failures:
+        print(f"❌ {failures} module(s) over budget or importing heavy packages")
+        sys.exit(1)
+    print("✅ All startup imports within budget")
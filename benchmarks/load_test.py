@@ -0,0 +1,462 @@
+"""
+Load Test
+Replays resume uploads and manual-entry profiles against the analyzer
+(parse -> predict -> top company matches) from several worker processes,
+with open-loop Poisson arrivals or closed-loop at full speed. Reports
+throughput, latency percentiles, error rates and per-worker RSS over time
+
+The in-process adapter runs the same steps as app.py in each worker; with
+--url requests go to a local HTTP adapter started with --serve instead
+
+Usage:
+    python -m benchmarks.load_test --profiles 500 --workers 4 --rate 50
+    python -m benchmarks.load_test --pdf-dir path/to/resumes --workers 2 --rate 5 --duration 60
+    python -m benchmarks.load_test --serve --port 8765
+    python -m benchmarks.load_test --url http://127.0.0.1:8765/analyze --profiles 200 --workers 8
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import random
+import base64
+import hashlib
+import argparse
+import tempfile
+import traceback
+import multiprocessing as mp
+from pathlib import Path
+from collections import Counter, defaultdict
+
+import numpy as np
+
+
+SKILL_POOL = ['Python', 'Java', 'C++', 'DSA', 'SQL', 'React', 'Node.js', 'AWS', 'Docker',
+              'Machine Learning', 'Excel', 'Communication', 'System Design', 'JavaScript']
+PERCENTILES = [50, 90, 95, 99]
+RSS_SAMPLE_INTERVAL = 1.0   # Seconds between RSS samples per worker
+
+
+def current_rss_mb():
+    """Resident set size of this process in MB (psutil if installed, else /proc)"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / 2**20
+    except ImportError:
+        pass
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+    except (OSError, ValueError):
+        return float('nan')
+
+
+def synthetic_profile(rng):
+    """Random manual-entry profile in the app's student_profile shape"""
+    return {
+        'cgpa': round(rng.uniform(5.5, 9.8), 2),
+        'tenth_marks': round(rng.uniform(55, 98)),
+        'twelfth_marks': round(rng.uniform(55, 98)),
+        'skills': rng.sample(SKILL_POOL, rng.randint(2, 7)),
+        'internships': rng.randint(0, 1),
+        'training': rng.randint(0, 1),
+        'projects': rng.randint(0, 1),
+        'technical_course': rng.randint(0, 1),
+        'communication_level': rng.randint(1, 5),
+        'technical_skills_score': rng.randint(20, 95),
+    }
+
+
+def build_corpus(pdf_dir=None, n_profiles=0, profiles_path=None, seed=0):
+    """List of (kind, payload) requests: ('pdf', path) or ('profile', dict)"""
+    corpus = []
+    if pdf_dir:
+        corpus += [('pdf', str(p)) for p in sorted(Path(pdf_dir).rglob('*.pdf'))]
+    if profiles_path:
+        with open(profiles_path, 'r') as f:
+            corpus += [('profile', json.loads(line)) for line in f if line.strip()]
+    rng = random.Random(seed)
+    corpus += [('profile', synthetic_profile(rng)) for _ in range(n_profiles)]
+    return corpus
+
+
+class InProcessAnalyzer:
+    """The app's parse -> predict -> match flow as a plain function call"""
+
+    def __init__(self, top_n=3, parse_cache=True):
+        from src.Model_Artifacts_12 import get_predictor
+        from src.Job_Matcher_06 import load_company_database
+
+        self.top_n = top_n
+        self.predictor = get_predictor()
+        self.companies = load_company_database()
+        self.parse_cache = {} if parse_cache else None
+
+    def warm_up(self, parse_pdfs=False):
+        """Pay one-off initialization (model load, spaCy) before the clock starts"""
+        if parse_pdfs:
+            from src.Resume_Parser_07 import get_nlp
+            get_nlp()
+        self.analyze_profile(synthetic_profile(random.Random(0)))
+
+    def parse_pdf(self, pdf_bytes):
+        """Parse uploaded PDF bytes, once per distinct file when caching (as the app does)"""
+        key = hashlib.sha256(pdf_bytes).hexdigest()
+        if self.parse_cache is not None and key in self.parse_cache:
+            return self.parse_cache[key]
+
+        from src.Resume_Parser_07 import parse_resume
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
+            tmp_file.write(pdf_bytes)
+            tmp_path = tmp_file.name
+        try:
+            parsed = parse_resume(tmp_path)
+        finally:
+            os.unlink(tmp_path)
+        if not parsed:
+            raise ValueError("resume could not be parsed")
+        if self.parse_cache is not None:
+            self.parse_cache[key] = parsed
+        return parsed
+
+    def analyze_profile(self, profile):
+        from src.Job_Matcher_06 import get_top_matches
+        from src.Records_09 import profile_to_features
+
+        proba = self.predictor.predict_proba(np.array([profile_to_features(profile)]))[0]
+        predicted = self.predictor.class_map[int(self.predictor.classes[proba.argmax()])]
+        matches = get_top_matches(profile, predicted_category=predicted, top_n=self.top_n, companies=self.companies)
+        return {'predicted_category': predicted, 'matches': len(matches)}
+
+    def handle(self, kind, payload):
+        if kind == 'pdf':
+            with open(payload, 'rb') as f:
+                payload = self.parse_pdf(f.read())
+        return self.analyze_profile(payload)
+
+
+class HttpAnalyzer:
+    """Client for the local HTTP adapter (see serve())"""
+
+    def __init__(self, url, timeout=60):
+        self.url = url
+        self.timeout = timeout
+
+    def warm_up(self, parse_pdfs=False):
+        self.handle('profile', synthetic_profile(random.Random(0)))
+
+    def handle(self, kind, payload):
+        import urllib.error
+        import urllib.request
+
+        if kind == 'pdf':
+            with open(payload, 'rb') as f:
+                payload = base64.b64encode(f.read()).decode('ascii')
+        body = json.dumps({'kind': kind, 'payload': payload}).encode()
+        request = urllib.request.Request(self.url, data=body, headers={'Content-Type': 'application/json'})
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            # The adapter reports the server-side exception in the body
+            return json.loads(e.read() or b'{}') or {'error': str(e)}
+
+
+def serve(host='127.0.0.1', port=8765, parse_cache=True):
+    """Minimal threaded HTTP adapter: POST {"kind", "payload"} to /analyze"""
+    from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+    analyzer = InProcessAnalyzer(parse_cache=parse_cache)
+    analyzer.warm_up()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            try:
+                request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                if request['kind'] == 'pdf':
+                    result = analyzer.analyze_profile(analyzer.parse_pdf(base64.b64decode(request['payload'])))
+                else:
+                    result = analyzer.handle('profile', request['payload'])
+                status, body = 200, result
+            except Exception as e:
+                status, body = 500, {'error': f"{type(e).__name__}: {e}"}
+            body['server_rss_mb'] = round(current_rss_mb(), 1)
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    print(f"🌐 Analyzer listening on http://{host}:{port}/analyze (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+def worker_main(worker_id, tasks, results, url, parse_cache, parse_pdfs):
+    """Worker process: warm up, then serve requests until a None task arrives"""
+    start = time.perf_counter()
+    try:
+        analyzer = HttpAnalyzer(url) if url else InProcessAnalyzer(parse_cache=parse_cache)
+        analyzer.warm_up(parse_pdfs)
+    except Exception:
+        results.put(('fatal', worker_id, traceback.format_exc()))
+        return
+    results.put(('ready', worker_id, time.perf_counter() - start, current_rss_mb()))
+
+    last_sample = 0.0
+    while True:
+        try:
+            task = tasks.get(timeout=RSS_SAMPLE_INTERVAL)
+        except queue.Empty:
+            task = ()
+        now = time.time()
+        if now - last_sample >= RSS_SAMPLE_INTERVAL:
+            results.put(('rss', worker_id, now, current_rss_mb()))
+            last_sample = now
+        if task is None:
+            break
+        if not task:
+            continue
+
+        request_id, scheduled, kind, payload = task
+        started = time.time()
+        error = server_rss = None
+        try:
+            response = analyzer.handle(kind, payload)
+            error = response.get('error')
+            server_rss = response.get('server_rss_mb')
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        finished = time.time()
+        results.put(('result', worker_id, {
+            'id': request_id,
+            'kind': kind,
+            'scheduled': scheduled if scheduled is not None else started,
+            'started': started,
+            'finished': finished,
+            'error': error,
+            'server_rss_mb': server_rss,
+        }))
+    results.put(('done', worker_id))
+
+
+def run_load(corpus, workers=4, rate=0.0, n_requests=None, duration=None,
+             url=None, parse_cache=True, seed=0):
+    """
+    Replay the corpus against the analyzer
+    rate > 0: open loop, Poisson arrivals at `rate` requests/s (latency includes queueing)
+    rate = 0: closed loop, every worker busy all the time
+    Stops after n_requests, or duration seconds, or one pass over the corpus
+    Returns dict with per-request records, RSS samples and worker warm-up times
+    """
+    if not corpus:
+        raise ValueError("Corpus is empty: pass --pdf-dir, --profiles or --profiles-file")
+    n_requests = n_requests or (None if duration else len(corpus))
+    parse_pdfs = any(kind == 'pdf' for kind, _ in corpus)
+
+    tasks = mp.Queue(maxsize=max(2 * workers, 1) if rate <= 0 else 0)
+    results = mp.Queue()
+    procs = [
+        mp.Process(target=worker_main, args=(i, tasks, results, url, parse_cache, parse_pdfs), daemon=True)
+        for i in range(workers)
+    ]
+    for p in procs:
+        p.start()
+
+    # Wait for every worker to finish its warm-up so cold start is reported separately
+    warmup, rss = {}, defaultdict(list)
+    while len(warmup) < workers:
+        message = results.get()
+        if message[0] == 'fatal':
+            for p in procs:
+                p.terminate()
+            raise RuntimeError(f"Worker {message[1]} failed to start:\n{message[2]}")
+        if message[0] == 'ready':
+            warmup[message[1]] = message[2]
+            rss[message[1]].append((time.time(), message[3]))
+    print(f"🔥 {workers} workers ready (warm-up {max(warmup.values()):.2f}s max)")
+
+    rng = random.Random(seed)
+    records = []
+
+    def drain():
+        while True:
+            try:
+                message = results.get_nowait()
+            except queue.Empty:
+                return
+            collect(message)
+
+    done = set()
+
+    def collect(message):
+        if message[0] == 'result':
+            records.append(message[2])
+        elif message[0] == 'rss':
+            rss[message[1]].append((message[2], message[3]))
+        elif message[0] == 'done':
+            done.add(message[1])
+
+    t0 = time.time()
+    next_arrival = t0
+    sent = 0
+    while True:
+        if n_requests is not None and sent >= n_requests:
+            break
+        if duration is not None and time.time() - t0 >= duration:
+            break
+        kind, payload = corpus[sent % len(corpus)]
+        scheduled = None
+        if rate > 0:
+            next_arrival += rng.expovariate(rate)
+            delay = next_arrival - time.time()
+            if delay > 0:
+                time.sleep(delay)
+            scheduled = next_arrival
+        tasks.put((sent, scheduled, kind, payload))
+        sent += 1
+        if sent % 50 == 0:
+            drain()
+
+    for _ in procs:
+        tasks.put(None)
+    while len(done) < workers:
+        collect(results.get())
+    for p in procs:
+        p.join()
+
+    return {'t0': t0, 'records': records, 'rss': dict(rss), 'warmup': warmup, 'sent': sent}
+
+
+def summarize(run):
+    """Throughput, latency percentiles, errors and per-second timelines"""
+    records = sorted(run['records'], key=lambda r: r['finished'])
+    t0 = run['t0']
+    ok = [r for r in records if not r['error']]
+    errors = Counter(r['error'].splitlines()[0][:120] for r in records if r['error'])
+    elapsed = max((r['finished'] for r in records), default=t0) - t0
+
+    def percentiles(values):
+        if not values:
+            return {}
+        values = np.asarray(values) * 1000
+        stats = {f"p{p}": round(float(np.percentile(values, p)), 2) for p in PERCENTILES}
+        stats['mean'] = round(float(values.mean()), 2)
+        stats['max'] = round(float(values.max()), 2)
+        return stats
+
+    timeline = defaultdict(lambda: {'completed': 0, 'errors': 0, 'latency': []})
+    for r in records:
+        bucket = timeline[int(r['finished'] - t0)]
+        bucket['completed'] += 1
+        bucket['errors'] += bool(r['error'])
+        bucket['latency'].append(r['finished'] - r['scheduled'])
+
+    # With the HTTP adapter the analyzer's memory is the server's, reported per response
+    samples_by_worker = dict(run['rss'])
+    server_samples = [(r['finished'], r['server_rss_mb']) for r in records if r.get('server_rss_mb') is not None]
+    if server_samples:
+        samples_by_worker['server'] = server_samples
+
+    rss_timeline = {}
+    for worker, samples in sorted(samples_by_worker.items(), key=lambda item: str(item[0])):
+        per_second = {}
+        for t, mb in samples:
+            second = max(int(t - t0), 0)
+            per_second[second] = max(per_second.get(second, 0.0), round(mb, 1))
+        rss_timeline[worker] = per_second
+
+    return {
+        'requests': len(records),
+        'sent': run['sent'],
+        'elapsed_s': round(elapsed, 3),
+        'throughput_rps': round(len(ok) / elapsed, 2) if elapsed > 0 else 0.0,
+        'error_rate': round(len(records) and (len(records) - len(ok)) / len(records), 4),
+        'errors': dict(errors.most_common(10)),
+        'latency_ms': percentiles([r['finished'] - r['scheduled'] for r in ok]),
+        'service_ms': percentiles([r['finished'] - r['started'] for r in ok]),
+        'latency_ms_by_kind': {
+            kind: percentiles([r['finished'] - r['scheduled'] for r in ok if r['kind'] == kind])
+            for kind in sorted({r['kind'] for r in ok})
+        },
+        'warmup_s': {w: round(s, 3) for w, s in sorted(run['warmup'].items())},
+        'timeline': [
+            {
+                'second': second,
+                'completed': bucket['completed'],
+                'errors': bucket['errors'],
+                'p95_ms': round(float(np.percentile(bucket['latency'], 95)) * 1000, 2),
+            }
+            for second, bucket in sorted(timeline.items())
+        ],
+        'rss_mb': rss_timeline,
+    }
+
+
+def display_summary(summary):
+    print("\n" + "=" * 70)
+    print(f"📈 LOAD TEST ({summary['requests']} requests in {summary['elapsed_s']}s)")
+    print("=" * 70)
+    print(f"⚡ Throughput: {summary['throughput_rps']} req/s | Error rate: {summary['error_rate']:.2%}")
+    for label, key in (('Latency', 'latency_ms'), ('Service time', 'service_ms')):
+        stats = summary[key]
+        if stats:
+            print(f"⏱️  {label} (ms): " + ' | '.join(f"{k} {v}" for k, v in stats.items()))
+    for kind, stats in summary['latency_ms_by_kind'].items():
+        if stats:
+            print(f"   {kind}: p50 {stats['p50']} ms | p95 {stats['p95']} ms")
+    for error, n in summary['errors'].items():
+        print(f"❌ {n} x {error}")
+
+    print("\n🧠 RSS per worker (MB, max per second):")
+    for worker, per_second in summary['rss_mb'].items():
+        values = list(per_second.values())
+        if values:
+            name = worker if isinstance(worker, str) else f"worker {worker}"
+            print(f"   {name}: start {values[0]} -> end {values[-1]} (peak {max(values)})")
+    print("=" * 70)
+
+
+# Command line entry point
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay resume uploads and profiles against the analyzer")
+    parser.add_argument('--pdf-dir', help="Folder of resume PDFs to replay")
+    parser.add_argument('--profiles', type=int, default=0, help="Number of synthetic manual-entry profiles")
+    parser.add_argument('--profiles-file', help="JSONL of manual-entry profiles to replay")
+    parser.add_argument('--workers', type=int, default=4, help="Concurrent worker processes")
+    parser.add_argument('--rate', type=float, default=0.0, help="Mean arrival rate in req/s (0 = closed loop)")
+    parser.add_argument('--requests', type=int, help="Total requests (default: one pass over the corpus)")
+    parser.add_argument('--duration', type=float, help="Stop sending after this many seconds")
+    parser.add_argument('--no-parse-cache', action='store_true', help="Reparse identical PDFs on every request")
+    parser.add_argument('--url', help="Send requests to a local HTTP adapter instead of in-process")
+    parser.add_argument('--serve', action='store_true', help="Run the local HTTP adapter")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="Write the full summary as JSON")
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(port=args.port, parse_cache=not args.no_parse_cache)
+        sys.exit(0)
+
+    corpus = build_corpus(args.pdf_dir, args.profiles, args.profiles_file, args.seed)
+    print(f"📦 Corpus: {sum(k == 'pdf' for k, _ in corpus)} PDFs, {sum(k == 'profile' for k, _ in corpus)} profiles")
+    run = run_load(
+        corpus, workers=args.workers, rate=args.rate, n_requests=args.requests, duration=args.duration,
+        url=args.url, parse_cache=not args.no_parse_cache, seed=args.seed,
+    )
+    summary = summarize(run)
+    display_summary(summary)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(summary, f, indent=2)
+        print(f"💾 Summary written to {args.output}")
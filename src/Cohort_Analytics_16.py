@@ -0,0 +1,260 @@
+"""
+Cohort Skill-Gap Analytics
+Streams student x company matches and folds them into compact counters:
+most-missing skills per company / company category / package tier,
+cutoff eligibility per CGPA band and match-score distributions
+Memory depends on the number of companies and skills, not on students x companies
+
+Usage: python -m src.Cohort_Analytics_16 cohort_results.jsonl [--scope predicted] [--output report.json]
+"""
+
+import json
+import math
+import argparse
+from collections import Counter, defaultdict
+
+from src.Job_Matcher_06 import load_company_database, iter_matches, meets_cutoffs
+
+
+SCORE_BIN_WIDTH = 10   # Match score histogram bins: 0-9, 10-19, ..., 90-100
+CGPA_BAND_WIDTH = 0.5
+
+
+def cgpa_band(cgpa, width=CGPA_BAND_WIDTH):
+    """Label such as '7.5-8.0' for a CGPA value; 10.0 falls in the top band"""
+    low = min(math.floor(cgpa / width) * width, 10.0 - width)
+    return f"{low:.1f}-{low + width:.1f}"
+
+
+def score_bin(score):
+    return min(int(score // SCORE_BIN_WIDTH), 100 // SCORE_BIN_WIDTH - 1)
+
+
+class ScoreStats:
+    """Running count / mean / min / max plus a fixed-width histogram"""
+
+    __slots__ = ('count', 'total', 'min', 'max', 'histogram')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.histogram = [0] * (100 // SCORE_BIN_WIDTH)
+
+    def add(self, score):
+        self.count += 1
+        self.total += score
+        self.min = min(self.min, score)
+        self.max = max(self.max, score)
+        self.histogram[score_bin(score)] += 1
+
+    def merge(self, other):
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.histogram = [a + b for a, b in zip(self.histogram, other.histogram)]
+
+    def to_dict(self):
+        if not self.count:
+            return {'count': 0}
+        return {
+            'count': self.count,
+            'mean': round(self.total / self.count, 2),
+            'min': self.min,
+            'max': self.max,
+            'histogram': {
+                f"{i * SCORE_BIN_WIDTH}-{(i + 1) * SCORE_BIN_WIDTH - (1 if i < len(self.histogram) - 1 else 0)}": n
+                for i, n in enumerate(self.histogram)
+            },
+        }
+
+
+class CohortAggregator:
+    """
+    Incremental aggregation of match results
+    Aggregators built on separate shards can be combined with merge()
+    """
+
+    def __init__(self):
+        self.students = 0
+        self.company_names = {}
+        self.predicted = Counter()
+        self.company_pairs = Counter()
+        self.company_eligible = Counter()
+        self.company_gaps = defaultdict(Counter)
+        self.category_gaps = defaultdict(Counter)
+        self.category_pairs = Counter()
+        self.tier_gaps = defaultdict(Counter)
+        self.tier_pairs = Counter()
+        self.band_students = Counter()
+        self.band_pairs = Counter()
+        self.band_eligible = Counter()
+        self.company_scores = defaultdict(ScoreStats)
+        self.overall_scores = ScoreStats()
+
+    def add_match(self, student_profile, company, match):
+        """Fold one student-company match into the counters (companies keyed by id)"""
+        company_id = company['id']
+        self.company_names[company_id] = company['name']
+        band = cgpa_band(student_profile['cgpa'])
+        eligible = meets_cutoffs(student_profile, company)
+        gap = match.skills_gap
+
+        self.company_pairs[company_id] += 1
+        self.company_eligible[company_id] += eligible
+        self.company_gaps[company_id].update(gap)
+        self.category_gaps[company['category']].update(gap)
+        self.category_pairs[company['category']] += 1
+        self.tier_gaps[company['package_category']].update(gap)
+        self.tier_pairs[company['package_category']] += 1
+        self.band_pairs[band] += 1
+        self.band_eligible[band] += eligible
+        self.company_scores[company_id].add(match.match_score)
+        self.overall_scores.add(match.match_score)
+
+    def add_student(self, student_profile, companies, predicted_category=None):
+        """Stream every match for one student through the aggregator"""
+        self.students += 1
+        self.band_students[cgpa_band(student_profile['cgpa'])] += 1
+        if predicted_category:
+            self.predicted[predicted_category] += 1
+        for company, match in zip(companies, iter_matches(student_profile, companies)):
+            self.add_match(student_profile, company, match)
+
+    def merge(self, other):
+        """Combine counters from another aggregator (e.g. a parallel shard)"""
+        self.students += other.students
+        self.company_names.update(other.company_names)
+        for attr in ('predicted', 'company_pairs', 'company_eligible', 'category_pairs', 'tier_pairs',
+                     'band_students', 'band_pairs', 'band_eligible'):
+            getattr(self, attr).update(getattr(other, attr))
+        for attr in ('company_gaps', 'category_gaps', 'tier_gaps'):
+            mine = getattr(self, attr)
+            for key, counter in getattr(other, attr).items():
+                mine[key].update(counter)
+        for company_id, stats in other.company_scores.items():
+            self.company_scores[company_id].merge(stats)
+        self.overall_scores.merge(other.overall_scores)
+        return self
+
+    def report(self, top_k=5):
+        """Summary dict with the top_k most-missing skills per group"""
+        def top_gaps(groups, pairs):
+            result = {}
+            for key, counter in sorted(groups.items()):
+                total = pairs[key]
+                result[key] = [
+                    {'skill': skill, 'missing_for': n, 'share': round(n / total, 3) if total else 0.0}
+                    for skill, n in counter.most_common(top_k)
+                ]
+            return result
+
+        def by_company(values):
+            return {company_id: {'name': self.company_names[company_id], **value}
+                    for company_id, value in values.items()}
+
+        return {
+            'students': self.students,
+            'predicted_categories': dict(self.predicted),
+            'missing_skills_by_company': by_company({
+                company_id: {'missing_skills': gaps}
+                for company_id, gaps in top_gaps(self.company_gaps, self.company_pairs).items()
+            }),
+            'missing_skills_by_category': top_gaps(self.category_gaps, self.category_pairs),
+            'missing_skills_by_tier': top_gaps(self.tier_gaps, self.tier_pairs),
+            'eligibility_by_company': by_company({
+                company_id: {'eligible_rate': round(self.company_eligible[company_id] / n, 3)}
+                for company_id, n in sorted(self.company_pairs.items())
+            }),
+            'eligibility_by_cgpa_band': {
+                band: {
+                    'students': self.band_students[band],
+                    'eligible_rate': round(self.band_eligible[band] / self.band_pairs[band], 3)
+                    if self.band_pairs[band] else 0.0,
+                }
+                for band in sorted(self.band_students)
+            },
+            'score_distribution': self.overall_scores.to_dict(),
+            'score_distribution_by_company': by_company({
+                company_id: stats.to_dict() for company_id, stats in sorted(self.company_scores.items())
+            }),
+        }
+
+
+def iter_cohort_results(jsonl_path, include_duplicates=False):
+    """
+    Yield (profile, predicted_category) from Cohort_Pipeline_15 output, one line at a time
+    Re-uploads flagged with duplicate_of are skipped so each student counts once,
+    unless include_duplicates is True
+    """
+    with open(jsonl_path, 'r') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            if row.get('error') or not row.get('parsed'):
+                continue
+            if row.get('duplicate_of') and not include_duplicates:
+                continue
+            yield row['parsed'], row.get('predicted_category')
+
+
+def analyze_cohort(students, companies=None, scope='all'):
+    """
+    Aggregate a stream of (profile, predicted_category) pairs
+    scope='predicted' only scores companies in the student's predicted tier
+    """
+    companies = companies if companies is not None else load_company_database()
+    by_tier = defaultdict(list)
+    for company in companies:
+        by_tier[company['package_category']].append(company)
+
+    aggregator = CohortAggregator()
+    for profile, predicted_category in students:
+        targets = by_tier.get(predicted_category, []) if scope == 'predicted' else companies
+        aggregator.add_student(profile, targets, predicted_category)
+    return aggregator
+
+
+def display_report(report, top_k=5):
+    """Print the headline numbers of a report"""
+    print("\n" + "=" * 70)
+    print(f"📊 COHORT SKILL-GAP REPORT ({report['students']} students)")
+    print("=" * 70)
+
+    print("\n🏷️  Most-missing skills by company category:")
+    for category, gaps in report['missing_skills_by_category'].items():
+        skills = ', '.join(f"{g['skill']} ({g['missing_for']})" for g in gaps[:top_k])
+        print(f"   {category.title()}: {skills}")
+
+    print("\n🎯 Cutoff eligibility by CGPA band:")
+    for band, stats in report['eligibility_by_cgpa_band'].items():
+        print(f"   {band}: {stats['eligible_rate']:.0%} of companies ({stats['students']} students)")
+
+    dist = report['score_distribution']
+    if dist['count']:
+        print(f"\n📈 Match scores: mean {dist['mean']} | min {dist['min']} | max {dist['max']}")
+    print("=" * 70)
+
+
+# Command line entry point
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Aggregate skill gaps for a processed cohort")
+    parser.add_argument('results', help="JSONL output of Cohort_Pipeline_15")
+    parser.add_argument('--scope', choices=['all', 'predicted'], default='all')
+    parser.add_argument('--top-k', type=int, default=5)
+    parser.add_argument('--output', help="Write the full report as JSON")
+    parser.add_argument('--include-duplicates', action='store_true',
+                        help="Also count resumes flagged as near-duplicates of another upload")
+    args = parser.parse_args()
+
+    students = iter_cohort_results(args.results, include_duplicates=args.include_duplicates)
+    aggregator = analyze_cohort(students, scope=args.scope)
+    report = aggregator.report(args.top_k)
+    display_report(report, args.top_k)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Full report written to {args.output}")
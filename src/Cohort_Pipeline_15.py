@@ -0,0 +1,328 @@
+"""
+Cohort Pipeline
+Batch version of the app flow for a whole folder of resumes:
+extract text -> NLP parse -> predict tier -> match companies
+Stages run concurrently and are connected by bounded queues; spaCy runs in
+a process pool. Every finished resume is appended to a JSONL file, which is
+also the checkpoint: re-running the same command skips finished resumes
+and retries the ones that failed
+
+Usage: python -m src.Cohort_Pipeline_15 <resume_dir> --output results.jsonl [--parquet results.parquet]
+"""
+
+import os
+import json
+import queue
+import argparse
+import threading
+import multiprocessing
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.Resume_Parser_07 import extract_text_from_pdf, parse_resume_text
+from src.Resume_Dedup_08 import ResumeDedupIndex, compute_minhash, find_duplicate
+from src.Model_Artifacts_12 import get_predictor, BUNDLE_DIR
+from src.Job_Matcher_06 import load_company_database, get_top_matches
+from src.Records_09 import profile_to_features
+
+
+QUEUE_SIZE = 64
+PREDICT_BATCH = 64
+_DONE = object()
+
+# Columns of a result row; failed and duplicate rows only fill some of them
+ROW_KEYS = ['file', 'error', 'duplicate_of', 'parsed', 'predicted_category', 'probabilities', 'top_factors', 'matches']
+
+
+def load_checkpoint(output_path, retry_errors=True):
+    """
+    Files already written to the output JSONL
+    Rows with an error are not counted as done unless retry_errors is False,
+    so transient failures are retried on the next run
+    A partial last line from a crash is truncated away
+    """
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+
+    good_bytes = 0
+    with open(output_path, 'rb') as f:
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                row = json.loads(line)
+                if not row.get('error') or not retry_errors:
+                    done.add(row['file'])
+            except (json.JSONDecodeError, KeyError):
+                break
+            good_bytes += len(line)
+
+    if good_bytes < os.path.getsize(output_path):
+        print(f"⚠️  Truncating incomplete checkpoint tail in {output_path}")
+        with open(output_path, 'r+b') as f:
+            f.truncate(good_bytes)
+    return done
+
+
+class Stage:
+    """
+    Worker threads reading from one bounded queue and writing to the next
+    Items that already failed pass straight through to the writer
+    """
+
+    def __init__(self, name, func, in_q, out_q, workers=1):
+        self.name = name
+        self.func = func
+        self.in_q = in_q
+        self.out_q = out_q
+        self.remaining = workers
+        self.lock = threading.Lock()
+        self.threads = [threading.Thread(target=self._run, name=f"{name}-{i}", daemon=True) for i in range(workers)]
+
+    def start(self):
+        for t in self.threads:
+            t.start()
+
+    def _run(self):
+        while True:
+            item = self.in_q.get()
+            if item is _DONE:
+                self.in_q.put(_DONE)  # Let sibling workers see it too
+                with self.lock:
+                    self.remaining -= 1
+                    if self.remaining == 0:
+                        self.out_q.put(_DONE)
+                return
+            if not item.get('error'):
+                try:
+                    self.func(item)
+                except Exception as e:
+                    item['error'] = f"{self.name}: {e}"
+            self.out_q.put(item)
+
+
+class CohortPipeline:
+    """Concurrent resume -> prediction -> matches pipeline"""
+
+    def __init__(self, extract_workers=4, nlp_workers=2, top_n=5, dedup=True,
+                 bundle_dir=BUNDLE_DIR, queue_size=QUEUE_SIZE):
+        self.extract_workers = extract_workers
+        self.nlp_workers = nlp_workers
+        self.top_n = top_n
+        self.queue_size = queue_size
+        self.predictor = get_predictor(bundle_dir)
+        self.companies = load_company_database()
+        self.dedup_index = ResumeDedupIndex() if dedup else None
+        self.dedup_lock = threading.Lock()
+        self.nlp_pool = None
+
+    # Stage functions (mutate the item in place)
+
+    def extract(self, item):
+        text = extract_text_from_pdf(item['file'])
+        if not text:
+            raise ValueError("no text extracted")
+        item['text'] = text
+
+    def parse(self, item):
+        text = item.pop('text')
+        signature = None
+        if self.dedup_index is not None:
+            signature = compute_minhash(text)
+            with self.dedup_lock:
+                match = find_duplicate(self.dedup_index, signature, text)
+            if match:
+                item['duplicate_of'], _, item['parsed'], _ = match
+                return
+
+        item['parsed'] = self.nlp_pool.submit(parse_resume_text, text).result()
+        if signature is not None:
+            with self.dedup_lock:
+                self.dedup_index.add(item['file'], signature, item['parsed'])
+
+    def predict_batch(self, items):
+        X = np.array([profile_to_features(item['parsed']) for item in items])
+        if self.predictor.can_explain:
+            result = self.predictor.predict_with_explanations(X)
+        else:
+            result = {'probabilities': self.predictor.predict_proba(X), 'contributions': None}
+        for i, (item, row) in enumerate(zip(items, result['probabilities'])):
+            code = int(self.predictor.classes[row.argmax()])
+            item['predicted_category'] = self.predictor.class_map[code]
+            item['probabilities'] = {
+                self.predictor.class_map[int(c)]: round(float(p), 4) for c, p in zip(self.predictor.classes, row)
+            }
+            if result['contributions'] is not None:
+                item['top_factors'] = dict(self.predictor.top_contributions(result['contributions'][i]))
+
+    def match(self, item):
+        item['matches'] = get_top_matches(
+            item['parsed'], item['predicted_category'], top_n=self.top_n, companies=self.companies
+        )
+
+    def _predict_loop(self, in_q, out_q):
+        """Single thread that micro-batches rows for one vectorized predict_proba call"""
+        finished = False
+        while not finished:
+            batch = [in_q.get()]
+            while len(batch) < PREDICT_BATCH:
+                try:
+                    batch.append(in_q.get_nowait())
+                except queue.Empty:
+                    break
+            if _DONE in batch:
+                finished = True
+                batch = [item for item in batch if item is not _DONE]
+
+            ok = [item for item in batch if not item.get('error')]
+            if ok:
+                try:
+                    self.predict_batch(ok)
+                except Exception as e:
+                    for item in ok:
+                        item['error'] = f"predict: {e}"
+            for item in batch:
+                out_q.put(item)
+        out_q.put(_DONE)
+
+    def run(self, pdf_paths, output_path, retry_errors=True):
+        """
+        Process resumes, appending one JSON line per resume to output_path
+        A retried resume gets a new line; readers should keep the last line per file
+        Returns (processed, errors, skipped)
+        """
+        done = load_checkpoint(output_path, retry_errors)
+        todo = [str(p) for p in pdf_paths if str(p) not in done]
+        skipped = len(pdf_paths) - len(todo)
+        if skipped:
+            print(f"♻️  Resuming: {skipped} resumes already in {output_path}")
+        if not todo:
+            return 0, 0, skipped
+
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(5)]
+        stages = [
+            Stage('extract', self.extract, queues[0], queues[1], self.extract_workers),
+            Stage('nlp', self.parse, queues[1], queues[2], self.nlp_workers),
+            Stage('match', self.match, queues[3], queues[4], 1),
+        ]
+        predict_thread = threading.Thread(target=self._predict_loop, args=(queues[2], queues[3]), daemon=True)
+
+        def feed():
+            for path in todo:
+                queues[0].put({'file': path})
+            queues[0].put(_DONE)
+
+        # Spawned, not forked: the pool starts its workers lazily from an nlp stage
+        # thread, and forking a process that already runs threads can deadlock the child
+        processed = errors = 0
+        spawn = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=self.nlp_workers, mp_context=spawn) as self.nlp_pool:
+            for stage in stages:
+                stage.start()
+            predict_thread.start()
+            threading.Thread(target=feed, daemon=True).start()
+
+            with open(output_path, 'a') as out:
+                while True:
+                    item = queues[4].get()
+                    if item is _DONE:
+                        break
+                    item.pop('text', None)
+                    out.write(json.dumps(item, default=str) + '\n')
+                    out.flush()
+                    processed += 1
+                    if item.get('error'):
+                        errors += 1
+                    if processed % 25 == 0:
+                        print(f"📊 {processed}/{len(todo)} resumes processed")
+
+        print(f"\n✅ Processed {processed} resumes ({errors} errors, {skipped} skipped) -> {output_path}")
+        return processed, errors, skipped
+
+
+def jsonl_to_parquet(jsonl_path, parquet_path):
+    """Write the JSONL results as Parquet (requires pyarrow)"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("pyarrow is required for Parquet output: pip install pyarrow") from None
+
+    # Last line per file wins, so retried failures replace their error rows
+    rows = {}
+    with open(jsonl_path, 'r') as f:
+        for line in f:
+            if line.strip():
+                row = json.loads(line)
+                rows[row['file']] = row
+    # from_pylist takes the columns from the first row only, so give every row
+    # the same keys; otherwise an error row first would drop the result columns
+    keys = ROW_KEYS + sorted({key for row in rows.values() for key in row} - set(ROW_KEYS))
+    rows = [{key: row.get(key) for key in keys} for row in rows.values()]
+    pq.write_table(pa.Table.from_pylist(rows), parquet_path)
+    print(f"✅ Wrote {len(rows)} rows to {parquet_path}")
+
+
+def check_parquet_round_trip():
+    """
+    Parquet output keeps every column when the first row is a failure, and the
+    last line per file wins. Raises AssertionError on failure
+    """
+    import tempfile
+    import pyarrow.parquet as pq
+
+    ok = {
+        'file': 'b.pdf', 'parsed': {'cgpa': 8.1, 'skills': ['python']}, 'predicted_category': 'Standard',
+        'probabilities': {'Standard': 0.7, 'Dream': 0.3}, 'matches': [{'company': 'Acme', 'match_score': 81.5}],
+    }
+    lines = [
+        {'file': 'a.pdf', 'error': 'extract: no text extracted'},
+        ok,
+        {**ok, 'file': 'c.pdf', 'duplicate_of': 'b.pdf'},
+        {'file': 'd.pdf', 'error': 'predict: boom'},
+        {**ok, 'file': 'd.pdf'},
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        jsonl_path, parquet_path = f"{tmp}/results.jsonl", f"{tmp}/results.parquet"
+        with open(jsonl_path, 'w') as f:
+            f.writelines(json.dumps(line) + '\n' for line in lines)
+        jsonl_to_parquet(jsonl_path, parquet_path)
+        rows = {row['file']: row for row in pq.read_table(parquet_path).to_pylist()}
+
+    assert sorted(rows) == ['a.pdf', 'b.pdf', 'c.pdf', 'd.pdf'], sorted(rows)
+    assert rows['a.pdf']['error'] and rows['a.pdf']['parsed'] is None
+    for name in ['b.pdf', 'c.pdf', 'd.pdf']:
+        assert rows[name]['error'] is None, name
+        assert rows[name]['predicted_category'] == 'Standard' and rows[name]['parsed']['cgpa'] == 8.1, name
+        assert rows[name]['matches'][0]['company'] == 'Acme', name
+    assert rows['c.pdf']['duplicate_of'] == 'b.pdf' and rows['b.pdf']['duplicate_of'] is None
+    print("✅ Parquet output keeps every column when the first row is an error")
+
+
+# Command line entry point
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == 'test':
+        check_parquet_round_trip()
+        sys.exit(0)
+
+    parser = argparse.ArgumentParser(description="Parse, predict and match a folder of resumes")
+    parser.add_argument('resume_dir')
+    parser.add_argument('--output', default='cohort_results.jsonl')
+    parser.add_argument('--parquet', help="Also write the results as Parquet")
+    parser.add_argument('--extract-workers', type=int, default=4)
+    parser.add_argument('--nlp-workers', type=int, default=max(1, (os.cpu_count() or 2) // 2))
+    parser.add_argument('--top-n', type=int, default=5)
+    parser.add_argument('--no-dedup', action='store_true', help="Run NLP even for near-duplicate resumes")
+    parser.add_argument('--no-retry-errors', action='store_true', help="Do not retry resumes that failed in earlier runs")
+    args = parser.parse_args()
+
+    pdf_paths = sorted(Path(args.resume_dir).rglob('*.pdf'))
+    pipeline = CohortPipeline(args.extract_workers, args.nlp_workers, args.top_n, dedup=not args.no_dedup)
+    pipeline.run(pdf_paths, args.output, retry_errors=not args.no_retry_errors)
+    if args.parquet:
+        jsonl_to_parquet(args.output, args.parquet)
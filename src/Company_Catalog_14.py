@@ -0,0 +1,268 @@
+"""
+Incremental Company Catalog
+Company changes (add / update / retire) are appended to a JSONL change log
+instead of rewriting Company_Database.json. Long-running workers keep a
+CompanyCatalog in memory and apply only the new log entries; compact()
+periodically folds the log back into the JSON snapshot
+
+Usage: python -m src.Company_Catalog_14 [compact | test]
+"""
+
+import os
+import json
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are still line-atomic for a single writer
+    fcntl = None
+
+
+SNAPSHOT_PATH = 'src/Company_Database.json'
+CHANGE_LOG_PATH = 'src/Company_Changes.jsonl'
+REFRESH_INTERVAL = 1.0  # Seconds between change-log checks
+
+
+class _LogLock:
+    """Exclusive lock on the change log for writers and compaction"""
+
+    def __init__(self, log_path):
+        self.lock_path = f"{log_path}.lock"
+        self.handle = None
+
+    def __enter__(self):
+        self.handle = open(self.lock_path, 'a')
+        if fcntl:
+            fcntl.flock(self.handle, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if fcntl:
+            fcntl.flock(self.handle, fcntl.LOCK_UN)
+        self.handle.close()
+
+
+def _read_snapshot(snapshot_path):
+    with open(snapshot_path, 'r') as f:
+        data = json.load(f)
+    return data['companies'], data.get('last_seq', 0)
+
+
+def _read_log(log_path, offset=0):
+    """
+    Complete entries after a byte offset
+    Returns (entries, new_offset); a trailing partial line is left for later
+    """
+    if not os.path.exists(log_path):
+        return [], 0
+    with open(log_path, 'rb') as f:
+        f.seek(offset)
+        chunk = f.read()
+    end = chunk.rfind(b'\n') + 1
+    entries = [json.loads(line) for line in chunk[:end].splitlines() if line.strip()]
+    return entries, offset + end
+
+
+def _last_seq(snapshot_path, log_path):
+    entries, _ = _read_log(log_path)
+    if entries:
+        return entries[-1]['seq']
+    return _read_snapshot(snapshot_path)[1]
+
+
+def append_change(op, payload, snapshot_path=SNAPSHOT_PATH, log_path=CHANGE_LOG_PATH):
+    """
+    Append one change to the log
+    op 'add': payload is a full company dict
+    op 'update': payload is {'id': ..., 'fields': {...}}
+    op 'retire': payload is {'id': ...}
+    Returns the sequence number of the change
+    """
+    if op not in ('add', 'update', 'retire'):
+        raise ValueError(f"Unknown catalog operation: {op}")
+    if op == 'add' and 'skills_required' not in payload:
+        raise ValueError("Added companies need a full record with skills_required")
+
+    with _LogLock(log_path):
+        seq = _last_seq(snapshot_path, log_path) + 1
+        line = json.dumps({'seq': seq, 'op': op, **payload}) + '\n'
+        with open(log_path, 'a') as f:
+            f.write(line)
+    return seq
+
+
+def add_company(company, **paths):
+    return append_change('add', company, **paths)
+
+
+def update_company(company_id, fields, **paths):
+    return append_change('update', {'id': company_id, 'fields': fields}, **paths)
+
+
+def retire_company(company_id, **paths):
+    return append_change('retire', {'id': company_id}, **paths)
+
+
+class CompanyCatalog:
+    """
+    In-memory company catalog kept current from the change log
+    Companies are indexed by id and by package_category
+    """
+
+    def __init__(self, snapshot_path=SNAPSHOT_PATH, log_path=CHANGE_LOG_PATH, refresh_interval=REFRESH_INTERVAL):
+        self.snapshot_path = snapshot_path
+        self.log_path = log_path
+        self.refresh_interval = refresh_interval
+        self._load()
+
+    def _load(self):
+        while True:
+            snapshot_mtime = os.stat(self.snapshot_path).st_mtime_ns
+            companies, self.applied_seq = _read_snapshot(self.snapshot_path)
+            self.by_id = {}
+            self.by_category = {}
+            for company in companies:
+                self._put(company)
+            self.log_offset = 0
+            self.log_inode = None
+            self.last_check = 0.0
+            self.refresh(force=True)
+            # A compaction between reading the snapshot and the log could hide changes
+            if os.stat(self.snapshot_path).st_mtime_ns == snapshot_mtime:
+                break
+
+    def _put(self, company):
+        self._drop(company['id'])
+        self.by_id[company['id']] = company
+        self.by_category.setdefault(company['package_category'], {})[company['id']] = company
+
+    def _drop(self, company_id):
+        old = self.by_id.pop(company_id, None)
+        if old is not None:
+            self.by_category.get(old['package_category'], {}).pop(company_id, None)
+
+    def apply(self, entry):
+        """Apply one change-log entry"""
+        op = entry['op']
+        if op == 'add':
+            self._put({k: v for k, v in entry.items() if k not in ('seq', 'op')})
+        elif op == 'update':
+            current = self.by_id.get(entry['id'])
+            if current is not None:
+                self._put({**current, **entry['fields']})
+        elif op == 'retire':
+            self._drop(entry['id'])
+        self.applied_seq = entry['seq']
+
+    def refresh(self, force=False):
+        """
+        Apply log entries written since the last refresh
+        Returns number of changes applied
+        """
+        now = time.monotonic()
+        if not force and now - self.last_check < self.refresh_interval:
+            return 0
+        self.last_check = now
+
+        try:
+            stat = os.stat(self.log_path)
+        except FileNotFoundError:
+            return 0
+
+        # Compaction replaces the log file. Entries we had not applied yet were
+        # folded into the snapshot, so reload it if it is ahead of us; otherwise
+        # rescan the new log, skipping applied entries
+        if stat.st_ino != self.log_inode or stat.st_size < self.log_offset:
+            if self.log_inode is not None and _read_snapshot(self.snapshot_path)[1] > self.applied_seq:
+                before = self.applied_seq
+                self._load()
+                return self.applied_seq - before
+            self.log_inode = stat.st_ino
+            self.log_offset = 0
+        if stat.st_size == self.log_offset:
+            return 0
+
+        entries, self.log_offset = _read_log(self.log_path, self.log_offset)
+        applied = 0
+        for entry in entries:
+            if entry['seq'] > self.applied_seq:
+                self.apply(entry)
+                applied += 1
+        return applied
+
+    def companies(self, package_category=None):
+        """Current companies, optionally for one package category"""
+        self.refresh()
+        if package_category:
+            return list(self.by_category.get(package_category, {}).values())
+        return list(self.by_id.values())
+
+    def __len__(self):
+        return len(self.by_id)
+
+
+def compact(snapshot_path=SNAPSHOT_PATH, log_path=CHANGE_LOG_PATH):
+    """
+    Fold the change log into a new snapshot and drop the applied entries
+    Both files are replaced atomically; running catalogs keep working
+    """
+    with _LogLock(log_path):
+        catalog = CompanyCatalog(snapshot_path, log_path)
+        companies = sorted(catalog.by_id.values(), key=lambda c: c['id'])
+
+        tmp_snapshot = f"{snapshot_path}.tmp"
+        with open(tmp_snapshot, 'w') as f:
+            json.dump({'companies': companies, 'last_seq': catalog.applied_seq}, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_snapshot, snapshot_path)
+
+        if os.path.exists(log_path):
+            tmp_log = f"{log_path}.tmp"
+            Path(tmp_log).write_text('')
+            os.replace(tmp_log, log_path)
+
+    print(f"✅ Compacted {len(companies)} companies into {snapshot_path} (seq {catalog.applied_seq})")
+    return catalog.applied_seq
+
+
+def check_compaction_interleaving():
+    """
+    A catalog that is behind when compact() runs must still pick up the folded changes
+    Raises AssertionError on failure
+    """
+    import shutil
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {'snapshot_path': f"{tmp}/companies.json", 'log_path': f"{tmp}/changes.jsonl"}
+        shutil.copy(SNAPSHOT_PATH, paths['snapshot_path'])
+        Path(paths['log_path']).write_text('')
+
+        worker = CompanyCatalog(**paths, refresh_interval=0)
+        retire_company(1, **paths)
+        update_company(2, {'min_cgpa': 5.0}, **paths)
+        compact(**paths)
+        add_company({**worker.by_id[3], 'id': 999, 'name': 'After Compaction'}, **paths)
+
+        worker.refresh()
+        fresh = CompanyCatalog(**paths)
+        assert worker.applied_seq == fresh.applied_seq == 3, (worker.applied_seq, fresh.applied_seq)
+        assert sorted(worker.by_id) == sorted(fresh.by_id), "worker and fresh catalog disagree"
+        assert 1 not in worker.by_id and 999 in worker.by_id
+        assert worker.by_id[2]['min_cgpa'] == 5.0
+    print("✅ Catalog picks up changes folded in by a concurrent compaction")
+
+
+# Command line entry point
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == 'compact':
+        compact()
+    elif len(sys.argv) > 1 and sys.argv[1] == 'test':
+        check_compaction_interleaving()
+    else:
+        catalog = CompanyCatalog()
+        print(f"📦 {len(catalog)} active companies (change log seq {catalog.applied_seq})")
+        for category, companies in sorted(catalog.by_category.items()):
+            print(f"   - {category}: {len(companies)}")
@@ -0,0 +1,168 @@
+"""
+SQLite Company Store
+Optional backend for large job catalogs: companies live in an indexed
+SQLite table with a skills join table, and category / location /
+eligibility filters run in SQL so only candidate companies get scored
+
+Usage: python -m src.Company_Store_13 [company_database.json] [company_database.db]
+"""
+
+import json
+import sqlite3
+
+
+COMPANY_DB_PATH = 'src/Company_Database.db'
+
+# Numeric columns are declared without a type (no affinity) so ints and floats
+# round-trip exactly as in the JSON and display fields stay identical
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS companies (
+    id               INTEGER PRIMARY KEY,
+    name             TEXT NOT NULL,
+    location         TEXT,
+    role             TEXT,
+    min_cgpa         NOT NULL,
+    min_tenth        NOT NULL,
+    min_twelfth      NOT NULL,
+    package_min,
+    package_max,
+    package_category TEXT,
+    category         TEXT,
+    focus            TEXT
+);
+CREATE TABLE IF NOT EXISTS company_skills (
+    company_id INTEGER NOT NULL REFERENCES companies(id) ON DELETE CASCADE,
+    position   INTEGER NOT NULL,
+    skill      TEXT NOT NULL,
+    skill_key  TEXT NOT NULL,
+    PRIMARY KEY (company_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_companies_package_category ON companies(package_category);
+CREATE INDEX IF NOT EXISTS idx_companies_min_cgpa ON companies(min_cgpa);
+CREATE INDEX IF NOT EXISTS idx_companies_min_tenth ON companies(min_tenth);
+CREATE INDEX IF NOT EXISTS idx_companies_min_twelfth ON companies(min_twelfth);
+CREATE INDEX IF NOT EXISTS idx_companies_location ON companies(location);
+CREATE INDEX IF NOT EXISTS idx_companies_category ON companies(category);
+CREATE INDEX IF NOT EXISTS idx_company_skills_key ON company_skills(skill_key);
+"""
+
+COMPANY_COLUMNS = (
+    'id', 'name', 'location', 'role', 'min_cgpa', 'min_tenth', 'min_twelfth',
+    'package_min', 'package_max', 'package_category', 'category', 'focus',
+)
+
+
+def connect(db_path=COMPANY_DB_PATH):
+    """Open the store and make sure the schema exists"""
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def upsert_company(conn, company):
+    """Insert or replace one company (JSON-shaped dict) with its skills"""
+    conn.execute(
+        f"INSERT OR REPLACE INTO companies ({', '.join(COMPANY_COLUMNS)}) "
+        f"VALUES ({', '.join('?' for _ in COMPANY_COLUMNS)})",
+        [company.get(col) for col in COMPANY_COLUMNS],
+    )
+    conn.execute("DELETE FROM company_skills WHERE company_id = ?", (company['id'],))
+    conn.executemany(
+        "INSERT INTO company_skills (company_id, position, skill, skill_key) VALUES (?, ?, ?, ?)",
+        [(company['id'], i, skill, skill.lower().strip()) for i, skill in enumerate(company['skills_required'])],
+    )
+
+
+def delete_company(conn, company_id):
+    conn.execute("DELETE FROM company_skills WHERE company_id = ?", (company_id,))
+    conn.execute("DELETE FROM companies WHERE id = ?", (company_id,))
+
+
+def import_from_json(json_path='src/Company_Database.json', db_path=COMPANY_DB_PATH, replace=True):
+    """
+    Load Company_Database.json into the SQLite store
+    Returns number of companies imported
+    """
+    with open(json_path, 'r') as f:
+        companies = json.load(f)['companies']
+
+    conn = connect(db_path)
+    try:
+        with conn:
+            if replace:
+                conn.execute("DELETE FROM company_skills")
+                conn.execute("DELETE FROM companies")
+            for company in companies:
+                upsert_company(conn, company)
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+
+    print(f"✅ Imported {len(companies)} companies into {db_path}")
+    return len(companies)
+
+
+def build_filters(package_category=None, location=None, category=None, student_profile=None):
+    """
+    WHERE clause + params for the company filters
+    A student_profile restricts results to companies whose cutoffs the student meets
+    """
+    clauses, params = [], []
+    if package_category:
+        clauses.append("package_category = ?")
+        params.append(package_category)
+    if location:
+        clauses.append("location = ?")
+        params.append(location)
+    if category:
+        clauses.append("category = ?")
+        params.append(category)
+    if student_profile is not None:
+        clauses.append("min_cgpa <= ? AND min_tenth <= ? AND min_twelfth <= ?")
+        params.extend([student_profile['cgpa'], student_profile['tenth_marks'], student_profile['twelfth_marks']])
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    return where, params
+
+
+def query_companies(db_path=COMPANY_DB_PATH, package_category=None, location=None,
+                    category=None, student_profile=None, conn=None):
+    """
+    Companies matching the filters, shaped like Company_Database.json entries
+    """
+    own_conn = conn is None
+    if own_conn:
+        conn = sqlite3.connect(db_path)
+    try:
+        where, params = build_filters(package_category, location, category, student_profile)
+        rows = conn.execute(
+            f"SELECT {', '.join(COMPANY_COLUMNS)} FROM companies {where} ORDER BY id", params
+        ).fetchall()
+        companies = {row[0]: dict(zip(COMPANY_COLUMNS, row), skills_required=[]) for row in rows}
+        if not companies:
+            return []
+
+        skill_rows = conn.execute(
+            f"SELECT company_id, skill FROM company_skills "
+            f"WHERE company_id IN (SELECT id FROM companies {where}) "
+            f"ORDER BY company_id, position",
+            params,
+        )
+        for company_id, skill in skill_rows:
+            companies[company_id]['skills_required'].append(skill)
+        return list(companies.values())
+    finally:
+        if own_conn:
+            conn.close()
+
+
+# Command line entry point
+if __name__ == "__main__":
+    import sys
+
+    json_path = sys.argv[1] if len(sys.argv) > 1 else 'src/Company_Database.json'
+    db_path = sys.argv[2] if len(sys.argv) > 2 else COMPANY_DB_PATH
+    import_from_json(json_path, db_path)
+
+    premium = query_companies(db_path, package_category='Premium')
+    print(f"🎯 Premium companies: {', '.join(c['name'] for c in premium)}")
@@ -0,0 +1,186 @@
+"""
+Columnar Dataset Store
+Converts the placement CSV datasets into one typed .npy file per column
+plus a schema.json, with string columns dictionary-encoded as small ints
+Loading memory-maps only the requested columns
+"""
+
+import re
+import json
+import hashlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+DATASETS_DIR = 'Datasets'
+COLUMNAR_DIR = 'Datasets/columnar'
+SCHEMA_FILE = 'schema.json'
+SCHEMA_VERSION = 1
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    """SHA-256 of a file, used to detect stale conversions"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _column_file(index, name):
+    slug = re.sub(r'[^a-z0-9]+', '_', name.lower()).strip('_')
+    return f"{index:03d}_{slug or 'col'}.npy"
+
+
+def _code_dtype(n_categories):
+    """Smallest signed int that holds the category codes (-1 = missing)"""
+    if n_categories < 2**7:
+        return np.int8
+    if n_categories < 2**15:
+        return np.int16
+    return np.int32
+
+
+def encode_column(series):
+    """
+    Encode one column for storage
+    Returns (array, schema entry without name/file)
+    """
+    if pd.api.types.is_bool_dtype(series):
+        return series.to_numpy(dtype=np.bool_), {'kind': 'numeric', 'dtype': 'bool'}
+
+    if pd.api.types.is_numeric_dtype(series):
+        values = series.to_numpy()
+        return values, {'kind': 'numeric', 'dtype': str(values.dtype)}
+
+    # Strings (Yes/No flags, boards, streams, categories) -> dictionary encoding
+    categorical = pd.Categorical(series.astype('object').where(series.notna(), None))
+    categories = [str(c) for c in categorical.categories]
+    codes = categorical.codes.astype(_code_dtype(len(categories)))
+    return codes, {'kind': 'categorical', 'dtype': str(codes.dtype), 'categories': categories}
+
+
+def convert_csv(csv_path, out_dir=None):
+    """
+    Convert one CSV into a columnar directory
+    Returns path to the output directory
+    """
+    csv_path = Path(csv_path)
+    out_dir = Path(out_dir) if out_dir else Path(COLUMNAR_DIR) / csv_path.stem
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    df = pd.read_csv(csv_path)
+    columns = []
+    for i, name in enumerate(df.columns):
+        values, entry = encode_column(df[name])
+        file_name = _column_file(i, name)
+        np.save(out_dir / file_name, np.ascontiguousarray(values), allow_pickle=False)
+        columns.append({'name': name, 'file': file_name, **entry})
+
+    schema = {
+        'version': SCHEMA_VERSION,
+        'source': csv_path.name,
+        'source_sha256': file_sha256(csv_path),
+        'rows': len(df),
+        'columns': columns,
+    }
+    with open(out_dir / SCHEMA_FILE, 'w') as f:
+        json.dump(schema, f, indent=2)
+
+    print(f"✅ {csv_path.name}: {len(df)} rows, {len(columns)} columns -> {out_dir}")
+    return out_dir
+
+
+def convert_all(datasets_dir=DATASETS_DIR, out_root=COLUMNAR_DIR):
+    """Convert every CSV in the datasets folder"""
+    return [convert_csv(p, Path(out_root) / p.stem) for p in sorted(Path(datasets_dir).glob('*.csv'))]
+
+
+def read_schema(dataset_dir):
+    with open(Path(dataset_dir) / SCHEMA_FILE, 'r') as f:
+        schema = json.load(f)
+    if schema.get('version') != SCHEMA_VERSION:
+        raise ValueError(f"Unsupported schema version in {dataset_dir}: {schema.get('version')}")
+    return schema
+
+
+def _resolve_dir(dataset):
+    path = Path(dataset)
+    if (path / SCHEMA_FILE).exists():
+        return path
+    return Path(COLUMNAR_DIR) / path.stem
+
+
+def is_stale(csv_path, dataset_dir=None):
+    """True if the columnar copy is missing or was built from a different CSV"""
+    dataset_dir = Path(dataset_dir) if dataset_dir else Path(COLUMNAR_DIR) / Path(csv_path).stem
+    if not (dataset_dir / SCHEMA_FILE).exists():
+        return True
+    return read_schema(dataset_dir)['source_sha256'] != file_sha256(csv_path)
+
+
+def load_columns(dataset, columns=None, mmap=True):
+    """
+    Load raw column arrays (category codes stay as ints)
+    Returns (dict of name -> array, schema)
+    """
+    dataset_dir = _resolve_dir(dataset)
+    schema = read_schema(dataset_dir)
+    by_name = {c['name']: c for c in schema['columns']}
+
+    if columns is None:
+        columns = [c['name'] for c in schema['columns']]
+    missing = [c for c in columns if c not in by_name]
+    if missing:
+        raise KeyError(f"Columns not in {dataset_dir}: {missing}")
+
+    mmap_mode = 'r' if mmap else None
+    arrays = {name: np.load(dataset_dir / by_name[name]['file'], mmap_mode=mmap_mode, allow_pickle=False)
+              for name in columns}
+    return arrays, schema
+
+
+def load_dataset(dataset, columns=None, mmap=True, decode=True):
+    """
+    Load a converted dataset as a DataFrame
+    dataset: dataset name (e.g. 'Eng_Dataset'), CSV path, or columnar directory
+    columns: optional column projection; other columns are never read
+    decode: return categoricals as pandas Categorical (False keeps the int codes)
+    """
+    arrays, schema = load_columns(dataset, columns, mmap)
+    by_name = {c['name']: c for c in schema['columns']}
+
+    data = {}
+    for name, values in arrays.items():
+        entry = by_name[name]
+        if decode and entry['kind'] == 'categorical':
+            data[name] = pd.Categorical.from_codes(values, categories=entry['categories'])
+        else:
+            data[name] = values
+    return pd.DataFrame(data, copy=False)
+
+
+def load_or_convert(csv_path, columns=None, mmap=True, decode=True):
+    """Load the columnar copy of a CSV, (re)converting it first if stale"""
+    dataset_dir = Path(COLUMNAR_DIR) / Path(csv_path).stem
+    if is_stale(csv_path, dataset_dir):
+        convert_csv(csv_path, dataset_dir)
+    return load_dataset(dataset_dir, columns, mmap, decode)
+
+
+# Test function
+if __name__ == "__main__":
+    import sys
+
+    targets = sys.argv[1:]
+    if targets:
+        for csv_path in targets:
+            convert_csv(csv_path)
+    else:
+        convert_all()
+
+    df = load_dataset('Placement_Dataset_Preprocessed', columns=['Cgpa', 'Package_Category'])
+    print(f"\n📊 Projection check: {df.shape[0]} rows")
+    print(df.head())
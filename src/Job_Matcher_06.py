@@ -6,132 +6,131 @@ Returns top 5 company recommendations with fit scores
 
 
 import json
-import pandas as pd
 
+from src.Records_09 import MatchResult
+from src.Match_Scoring_19 import score_companies, score_pair
 
-def load_company_database(json_path='src/company_database.json'):
+
+def load_company_database(json_path='src/Company_Database.json'):
     """Load company database from JSON file"""
     with open(json_path, 'r') as f:
         data = json.load(f)
     return data['companies']
 
 
-def calculate_match_score(student_profile, company):
+def match_skills(student_skills, required_skills):
+    """
+    Required skills covered by the student's skills
+    Both lists must already be lowercased and stripped
+    """
+    matched_skills = []
+    for req_skill in required_skills:
+        # Check exact match or partial match
+        for student_skill in student_skills:
+            if req_skill in student_skill or student_skill in req_skill:
+                matched_skills.append(req_skill)
+                break
+    return matched_skills
+
+
+def calculate_match_score(student_profile, company, profile=None):
     """
     Calculate match score between student and company
+    Weights come from the company's focus scoring profile (profile forces one by name)
     Returns score out of 100
     """
-    score = 0
-    max_score = 100
-    
-    # 1. CGPA Check (30 points)
-    if student_profile['cgpa'] >= company['min_cgpa']:
-        score += 30
-        # Bonus for exceeding requirement
-        if student_profile['cgpa'] >= company['min_cgpa'] + 1:
-            score += 5
-    elif student_profile['cgpa'] >= company['min_cgpa'] - 0.5:
-        # Partial credit if close
-        score += 15
-    
-    # 2. 10th Marks Check (10 points)
-    if student_profile['tenth_marks'] >= company['min_tenth']:
-        score += 10
-    elif student_profile['tenth_marks'] >= company['min_tenth'] - 5:
-        score += 5
-    
-    # 3. 12th Marks Check (10 points)
-    if student_profile['twelfth_marks'] >= company['min_twelfth']:
-        score += 10
-    elif student_profile['twelfth_marks'] >= company['min_twelfth'] - 5:
-        score += 5
-    
-    # 4. Skills Matching (40 points)
     student_skills = [s.lower().strip() for s in student_profile.get('skills', [])]
     required_skills = [s.lower().strip() for s in company['skills_required']]
-    
-    if len(required_skills) > 0:
-        matched_skills = []
-        for req_skill in required_skills:
-            # Check exact match or partial match
-            for student_skill in student_skills:
-                if req_skill in student_skill or student_skill in req_skill:
-                    matched_skills.append(req_skill)
-                    break
+    matched = len(match_skills(student_skills, required_skills))
+    return score_pair(student_profile, company, matched, profile)
+
+
+def meets_cutoffs(student_profile, company):
+    """True if the student clears the company's CGPA, 10th and 12th cutoffs"""
+    return (student_profile['cgpa'] >= company['min_cgpa']
+            and student_profile['tenth_marks'] >= company['min_tenth']
+            and student_profile['twelfth_marks'] >= company['min_twelfth'])
+
+
+def iter_matches(student_profile, companies, profile=None):
+    """
+    Yield an unsorted MatchResult for every company
+    Lets batch consumers stream matches without building the full list
+    Scores for all companies come from one vectorized scoring pass
+    """
+    student_skills = [s.lower().strip() for s in student_profile.get('skills', [])]
+    matched = [
+        match_skills(student_skills, [s.lower().strip() for s in company['skills_required']])
+        for company in companies
+    ]
+    scores = score_companies(student_profile, companies, [len(m) for m in matched], profile) if companies else []
+    
+    for company, company_matched, match_score in zip(companies, matched, scores):
+        matched_skills = [s.title() for s in company_matched]
         
-        skill_match_ratio = len(matched_skills) / len(required_skills)
-        skill_score = skill_match_ratio * 40
-        score += skill_score
-    else:
-        score += 20  # If no specific skills required
-    
-    # 5. Experience Bonus (10 points)
-    experience_score = 0
-    
-    if student_profile.get('internships', 0) > 0:
-        experience_score += 3
-    
-    if student_profile.get('projects', 0) > 0:
-        experience_score += 3
-    
-    if student_profile.get('training', 0) > 0:
-        experience_score += 2
-    
-    if student_profile.get('technical_course', 0) > 0:
-        experience_score += 2
-    
-    score += min(experience_score, 10)  # Cap at 10
-    
-    return min(score, max_score)  # Ensure max 100
+        yield MatchResult(
+            company=company['name'],
+            role=company['role'],
+            location=company['location'],
+            package_min=company['package_min'],
+            package_max=company['package_max'],
+            package_category=company['package_category'],
+            match_score=round(float(match_score), 1),
+            skills_required=company['skills_required'],
+            skills_matched=matched_skills,
+            cgpa_required=company['min_cgpa'],
+            meets_cgpa=student_profile['cgpa'] >= company['min_cgpa'],
+            focus=company['focus']
+        )
 
 
-def get_top_matches(student_profile, predicted_category=None, top_n=5):
+def get_top_matches(student_profile, predicted_category=None, top_n=5, as_records=False,
+                    location=None, eligible_only=False, db_path=None, companies=None, profile=None,
+                    category=None):
     """
     Get top N company matches for student
-    Filters by predicted category if provided
+    Filters by predicted category, location, company category (product / service / startup)
+    and (optionally) cutoff eligibility
+    With db_path the filters run in the SQLite company store instead of Python
+    companies: pre-loaded company list (e.g. CompanyCatalog.companies()) instead of the JSON
+    profile: score every company with this named scoring profile instead of its focus profile
+    Returns dicts, or MatchResult records if as_records is True
     """
     
-    companies = load_company_database()
-    
-    # Filter by predicted category if provided
-    if predicted_category:
-        companies = [c for c in companies if c['package_category'] == predicted_category]
+    if db_path:
+        from src.Company_Store_13 import query_companies
+        companies = query_companies(
+            db_path,
+            package_category=predicted_category,
+            location=location,
+            category=category,
+            student_profile=student_profile if eligible_only else None,
+        )
+    else:
+        if companies is None:
+            companies = load_company_database()
+        
+        # Filter by predicted category if provided
+        if predicted_category:
+            companies = [c for c in companies if c['package_category'] == predicted_category]
+        if location:
+            companies = [c for c in companies if c['location'] == location]
+        if category:
+            companies = [c for c in companies if c['category'] == category]
+        if eligible_only:
+            companies = [c for c in companies if meets_cutoffs(student_profile, c)]
     
     # Calculate scores for all companies
-    matches = []
-    for company in companies:
-        match_score = calculate_match_score(student_profile, company)
-        
-        # Get matched skills
-        student_skills = [s.lower().strip() for s in student_profile.get('skills', [])]
-        required_skills = [s.lower().strip() for s in company['skills_required']]
-        matched_skills = []
-        
-        for req_skill in required_skills:
-            for student_skill in student_skills:
-                if req_skill in student_skill or student_skill in req_skill:
-                    matched_skills.append(req_skill.title())
-                    break
-        
-        matches.append({
-            'company': company['name'],
-            'role': company['role'],
-            'location': company['location'],
-            'package': f"₹{company['package_min']}-{company['package_max']} LPA",
-            'package_category': company['package_category'],
-            'match_score': round(match_score, 1),
-            'skills_required': company['skills_required'],
-            'skills_matched': matched_skills,
-            'skills_gap': [s for s in company['skills_required'] if s.lower() not in [m.lower() for m in matched_skills]],
-            'cgpa_required': company['min_cgpa'],
-            'meets_cgpa': student_profile['cgpa'] >= company['min_cgpa'],
-            'focus': company['focus']
-        })
+    matches = list(iter_matches(student_profile, companies, profile))
     
     # Sort by match score
-    matches.sort(key=lambda x: x['match_score'], reverse=True)
+    matches.sort(key=lambda x: x.match_score, reverse=True)
+    top_matches = matches[:top_n]
     
-    return matches[:top_n]
+    if as_records:
+        return top_matches
+    # Display fields are only formatted for the matches that are returned
+    return [m.to_dict() for m in top_matches]
 
 
 def display_matches(matches):
@@ -153,7 +152,8 @@ def display_matches(matches):
         print(f"📍 Location: {match['location']}")
         print(f"💼 Role: {match['role']}")
         print(f"💰 Package: {match['package']} ({match['package_category']})")
-        print(f"🎯 CGPA Required: {match['cgpa_required']} | You: {'✅ MEET' if match['meets_cgpa'] else '❌ DON\'T MEET'}")
+        cgpa_status = '✅ MEET' if match['meets_cgpa'] else "❌ DON'T MEET"
+        print(f"🎯 CGPA Required: {match['cgpa_required']} | You: {cgpa_status}")
         print(f"📊 Focus: {match['focus'].replace('_', ' ').title()}")
         
         print(f"\n✅ Skills You Have ({len(match['skills_matched'])}):")
@@ -0,0 +1,255 @@
+"""
+Match Scoring Profiles
+Company match-score weights defined as data (src/Scoring_Profiles.json) and
+selected per company by its `focus`. Profiles are compiled once into a
+parameter matrix; scoring is a single vectorized NumPy pass over every
+student-company pair instead of re-reading weights per pair, with a plain
+Python fast path for one pair
+The "default" profile reproduces the original hardcoded weights exactly; every
+focus maps to it until recruiters supply their own weights
+
+Usage: python -m src.Match_Scoring_19 [profiles.json]
+"""
+
+import json
+import numpy as np
+
+
+PROFILES_PATH = 'src/Scoring_Profiles.json'
+
+# Compiled parameter layout: (section, key) per column of the profile matrix
+PARAMETERS = [
+    ('cgpa', 'points'), ('cgpa', 'bonus'), ('cgpa', 'bonus_margin'), ('cgpa', 'partial'), ('cgpa', 'partial_margin'),
+    ('tenth', 'points'), ('tenth', 'partial'), ('tenth', 'partial_margin'),
+    ('twelfth', 'points'), ('twelfth', 'partial'), ('twelfth', 'partial_margin'),
+    ('skills', 'points'), ('skills', 'no_requirements'),
+    ('experience', 'internships'), ('experience', 'projects'),
+    ('experience', 'training'), ('experience', 'technical_course'), ('experience', 'cap'),
+    (None, 'max_score'),
+]
+COLUMN = {f"{section}.{key}" if section else key: i for i, (section, key) in enumerate(PARAMETERS)}
+
+# Student profile keys that earn experience points, in PARAMETERS order
+EXPERIENCE_KEYS = ['internships', 'projects', 'training', 'technical_course']
+
+# Compiled profiles per process, keyed by path
+_PROFILES_CACHE = {}
+
+
+class ScoringProfiles:
+    """Named scoring profiles compiled into one (profiles x parameters) matrix"""
+
+    def __init__(self, names, matrix, focus_profiles, default_profile):
+        self.names = list(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.matrix = matrix
+        # Same parameters as plain floats per profile, for scoring a single pair
+        self.rows = {name: dict(zip(COLUMN, map(float, matrix[i]))) for i, name in enumerate(self.names)}
+        self.focus_profiles = dict(focus_profiles)
+        self.default_profile = default_profile
+
+    def profile_name(self, company, profile=None):
+        """Profile used for a company; profile forces one named profile"""
+        name = profile or self.focus_profiles.get(company.get('focus'), self.default_profile)
+        if name not in self.index:
+            raise KeyError(f"Unknown scoring profile: {name}")
+        return name
+
+    def profile_index(self, company, profile=None):
+        """Row of the matrix used for a company"""
+        return self.index[self.profile_name(company, profile)]
+
+    def company_arrays(self, companies, profile=None):
+        """Cutoffs and gathered profile parameters for a list of companies"""
+        rows = [self.profile_index(c, profile) for c in companies]
+        return {
+            'min_cgpa': np.array([c['min_cgpa'] for c in companies], dtype=np.float64),
+            'min_tenth': np.array([c['min_tenth'] for c in companies], dtype=np.float64),
+            'min_twelfth': np.array([c['min_twelfth'] for c in companies], dtype=np.float64),
+            'params': self.matrix[rows].reshape(len(rows), len(PARAMETERS)),
+        }
+
+
+def compile_profiles(config):
+    """
+    Validate a profiles config dict and compile it into a ScoringProfiles matrix
+    Raises ValueError on missing or non-numeric parameters
+    """
+    profiles = config.get('profiles', {})
+    default_profile = config.get('default_profile', 'default')
+    if default_profile not in profiles:
+        raise ValueError(f"Default scoring profile '{default_profile}' is not defined")
+
+    names = sorted(profiles)
+    matrix = np.empty((len(names), len(PARAMETERS)), dtype=np.float64)
+    for i, name in enumerate(names):
+        for j, (section, key) in enumerate(PARAMETERS):
+            try:
+                value = profiles[name][section][key] if section else profiles[name][key]
+                matrix[i, j] = float(value)
+            except (KeyError, TypeError, ValueError):
+                label = f"{section}.{key}" if section else key
+                raise ValueError(f"Scoring profile '{name}' has no valid '{label}'") from None
+
+    focus_profiles = config.get('focus_profiles', {})
+    unknown = sorted(set(focus_profiles.values()) - set(profiles))
+    if unknown:
+        raise ValueError(f"focus_profiles refers to undefined profiles: {unknown}")
+    return ScoringProfiles(names, matrix, focus_profiles, default_profile)
+
+
+def get_profiles(path=PROFILES_PATH, reload=False):
+    """
+    Process-wide compiled profiles, read and compiled once per path
+    reload=True recompiles after the JSON file was edited
+    """
+    profiles = _PROFILES_CACHE.get(path)
+    if profiles is None or reload:
+        with open(path, 'r') as f:
+            profiles = compile_profiles(json.load(f))
+        _PROFILES_CACHE[path] = profiles
+    return profiles
+
+
+def score_kernel(students, company, skill_ratio, has_skills):
+    """
+    Match scores for every student-company pair
+    students: dict of (S,) arrays cgpa, tenth_marks, twelfth_marks and (S, 4) experience flags
+    company: output of ScoringProfiles.company_arrays
+    skill_ratio: (S, C) share of required skills covered; has_skills: (C,) bool
+    Returns (S, C) float array
+    """
+    P = company['params']
+    p = {name: P[:, col] for name, col in COLUMN.items()}
+    cgpa = students['cgpa'][:, None]
+    tenth = students['tenth_marks'][:, None]
+    twelfth = students['twelfth_marks'][:, None]
+
+    # 1. CGPA: full points (+ bonus when well above the cutoff) or partial credit if close
+    cgpa_score = np.where(
+        cgpa >= company['min_cgpa'],
+        p['cgpa.points'] + np.where(cgpa >= company['min_cgpa'] + p['cgpa.bonus_margin'], p['cgpa.bonus'], 0.0),
+        np.where(cgpa >= company['min_cgpa'] - p['cgpa.partial_margin'], p['cgpa.partial'], 0.0),
+    )
+
+    # 2-3. 10th / 12th marks
+    tenth_score = np.where(
+        tenth >= company['min_tenth'], p['tenth.points'],
+        np.where(tenth >= company['min_tenth'] - p['tenth.partial_margin'], p['tenth.partial'], 0.0),
+    )
+    twelfth_score = np.where(
+        twelfth >= company['min_twelfth'], p['twelfth.points'],
+        np.where(twelfth >= company['min_twelfth'] - p['twelfth.partial_margin'], p['twelfth.partial'], 0.0),
+    )
+
+    # 4. Skills
+    skill_score = np.where(has_skills, skill_ratio * p['skills.points'], p['skills.no_requirements'])
+
+    # 5. Experience, capped
+    weights = P[:, COLUMN['experience.internships']:COLUMN['experience.technical_course'] + 1]
+    experience = np.minimum(students['experience'] @ weights.T, p['experience.cap'])
+
+    # Same summation order as the original scorer so default scores are bit-identical
+    score = cgpa_score + tenth_score + twelfth_score + skill_score + experience
+    return np.minimum(score, p['max_score'])
+
+
+def score_pair(student_profile, company, matched_count, profile=None, profiles=None):
+    """
+    Match score of one student-company pair with the compiled profile row
+    Same rules and summation order as score_kernel, without NumPy overhead
+    """
+    profiles = profiles or get_profiles()
+    p = profiles.rows[profiles.profile_name(company, profile)]
+    cgpa = student_profile['cgpa']
+
+    score = 0.0
+    if cgpa >= company['min_cgpa']:
+        score += p['cgpa.points']
+        if cgpa >= company['min_cgpa'] + p['cgpa.bonus_margin']:
+            score += p['cgpa.bonus']
+    elif cgpa >= company['min_cgpa'] - p['cgpa.partial_margin']:
+        score += p['cgpa.partial']
+
+    if student_profile['tenth_marks'] >= company['min_tenth']:
+        score += p['tenth.points']
+    elif student_profile['tenth_marks'] >= company['min_tenth'] - p['tenth.partial_margin']:
+        score += p['tenth.partial']
+
+    if student_profile['twelfth_marks'] >= company['min_twelfth']:
+        score += p['twelfth.points']
+    elif student_profile['twelfth_marks'] >= company['min_twelfth'] - p['twelfth.partial_margin']:
+        score += p['twelfth.partial']
+
+    required = len(company['skills_required'])
+    if required > 0:
+        score += matched_count / required * p['skills.points']
+    else:
+        score += p['skills.no_requirements']
+
+    experience = 0.0
+    for key in EXPERIENCE_KEYS:
+        if student_profile.get(key, 0) > 0:
+            experience += p['experience.' + key]
+    score += min(experience, p['experience.cap'])
+    return min(score, p['max_score'])
+
+
+def student_arrays(student_profiles):
+    """Kernel inputs for a list of student profiles"""
+    return {
+        'cgpa': np.array([s['cgpa'] for s in student_profiles], dtype=np.float64),
+        'tenth_marks': np.array([s['tenth_marks'] for s in student_profiles], dtype=np.float64),
+        'twelfth_marks': np.array([s['twelfth_marks'] for s in student_profiles], dtype=np.float64),
+        'experience': np.array(
+            [[float(s.get(key, 0) > 0) for key in EXPERIENCE_KEYS] for s in student_profiles], dtype=np.float64
+        ).reshape(len(student_profiles), len(EXPERIENCE_KEYS)),
+    }
+
+
+def score_companies(student_profile, companies, matched_counts, profile=None, profiles=None):
+    """
+    Match score of one student against each company
+    matched_counts: number of required skills the student covers, per company
+    Returns (C,) float array
+    """
+    profiles = profiles or get_profiles()
+    required = np.array([len(c['skills_required']) for c in companies], dtype=np.float64)
+    has_skills = required > 0
+    ratio = np.divide(np.asarray(matched_counts, dtype=np.float64), required,
+                      out=np.zeros_like(required), where=has_skills)
+    scores = score_kernel(
+        student_arrays([student_profile]), profiles.company_arrays(companies, profile), ratio[None, :], has_skills
+    )
+    return scores[0]
+
+
+# Test function
+if __name__ == "__main__":
+    import sys
+    import time
+
+    from src.Job_Matcher_06 import load_company_database
+
+    profiles = get_profiles(sys.argv[1]) if len(sys.argv) > 1 else get_profiles()
+    companies = load_company_database()
+    print(f"✅ Compiled {len(profiles.names)} scoring profiles: {', '.join(profiles.names)}")
+
+    rng = np.random.RandomState(0)
+    n_students = 10_000
+    students = {
+        'cgpa': np.round(rng.uniform(5.5, 10.0, n_students), 2),
+        'tenth_marks': rng.uniform(55, 98, n_students).round(),
+        'twelfth_marks': rng.uniform(55, 98, n_students).round(),
+        'experience': (rng.rand(n_students, len(EXPERIENCE_KEYS)) > 0.5).astype(np.float64),
+    }
+    required = np.array([len(c['skills_required']) for c in companies], dtype=np.float64)
+    ratio = rng.randint(0, 6, (n_students, len(companies))).clip(max=required) / required
+
+    start = time.perf_counter()
+    scores = score_kernel(students, profiles.company_arrays(companies), ratio, required > 0)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"⚡ Scored {scores.size:,} student-company pairs in {elapsed_ms:.1f} ms")
+    for name in profiles.names:
+        forced = score_kernel(students, profiles.company_arrays(companies, name), ratio, required > 0)
+        print(f"   {name}: mean score {forced.mean():.1f}")
@@ -0,0 +1,432 @@
+"""
+Model Artifact Bundles
+Versioned replacement for the raw Best_Placement_Model.pkl / Final_Scaler.pkl
+A bundle is a folder with a manifest.json (feature order, class map, library
+versions, per-file SHA-256) and one .npy file per array so weights can be
+memory-mapped and shared between worker processes through the page cache
+Linear models need no scikit-learn at load time; other models are stored
+with joblib and loaded with mmap_mode='r'
+
+Usage: python -m src.Model_Artifacts_12 [model.pkl scaler.pkl bundle_dir]
+"""
+
+import sys
+import json
+import pickle
+import hashlib
+import platform
+from pathlib import Path
+from datetime import datetime, timezone
+
+import numpy as np
+
+from src.Records_09 import FEATURE_COLUMNS, CLASS_MAP
+
+
+BUNDLE_FORMAT_VERSION = 1
+BUNDLE_DIR = 'Models/Placement_Bundle'
+MANIFEST_FILE = 'manifest.json'
+MODEL_FILE = 'model.joblib'
+
+# Loaded bundles per process, keyed by resolved path
+_PREDICTOR_CACHE = {}
+
+
+class BundleError(ValueError):
+    """Raised when a bundle is missing, corrupted or does not match expectations"""
+
+
+class ExplanationUnavailable(Exception):
+    """Raised when the bundled model type has no cheap per-feature explanation"""
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _library_versions():
+    versions = {'python': platform.python_version(), 'numpy': np.__version__}
+    try:
+        import sklearn
+        versions['scikit-learn'] = sklearn.__version__
+    except ImportError:
+        pass
+    return versions
+
+
+def _softmax(scores):
+    scores = scores - scores.max(axis=1, keepdims=True)
+    exp = np.exp(scores)
+    return exp / exp.sum(axis=1, keepdims=True)
+
+
+def _linear_link(model, n_features):
+    """Detect whether a linear model's probabilities are softmax or one-vs-rest"""
+    probe = np.random.RandomState(0).normal(size=(8, n_features))
+    scores = model.decision_function(probe)
+    proba = model.predict_proba(probe)
+    if np.allclose(_softmax(scores), proba):
+        return 'softmax'
+    ovr = 1.0 / (1.0 + np.exp(-scores))
+    if np.allclose(ovr / ovr.sum(axis=1, keepdims=True), proba):
+        return 'ovr'
+    return None
+
+
+def _tree_contributions(tree, X_scaled, normalize):
+    """
+    Path contributions of one scikit-learn tree: every split on a sample's
+    decision path credits the change in node value to the split feature
+    Returns (contributions (n, features, outputs), base (outputs,))
+    """
+    t = tree.tree_
+    values = t.value[:, 0, :].astype(np.float64)
+    if normalize:
+        values = values / values.sum(axis=1, keepdims=True)
+
+    # Node ids are assigned in pre-order, so sorted path indices run root -> leaf
+    paths = tree.decision_path(X_scaled)
+    nodes = paths.indices
+    rows = np.repeat(np.arange(len(X_scaled)), np.diff(paths.indptr))
+    same_path = rows[1:] == rows[:-1]
+    parent, child = nodes[:-1][same_path], nodes[1:][same_path]
+
+    contributions = np.zeros((len(X_scaled), X_scaled.shape[1], values.shape[1]))
+    np.add.at(contributions, (rows[1:][same_path], t.feature[parent]), values[child] - values[parent])
+    return contributions, values[0]
+
+
+class PlacementPredictor:
+    """
+    Scaler + model behind one predict/predict_proba API
+    Accepts DataFrames (columns matched by name), dicts or arrays in feature order
+    """
+
+    def __init__(self, feature_order, class_map, mean, scale, classes,
+                 coef=None, intercept=None, link=None, model=None, manifest=None):
+        self.feature_order = list(feature_order)
+        self.class_map = dict(class_map)
+        self.mean = mean
+        self.scale = scale
+        self.classes = classes
+        self.coef = coef
+        self.intercept = intercept
+        self.link = link
+        self.model = model
+        self.manifest = manifest or {}
+
+        # Explanation weights on raw inputs, precomputed once:
+        # coef * (x - mean) / scale == raw_weights * x - raw_offsets
+        if coef is not None:
+            self.raw_weights = np.asarray(coef) / np.asarray(scale)
+            self.raw_offsets = self.raw_weights * np.asarray(mean)
+
+    @property
+    def is_linear(self):
+        return self.coef is not None
+
+    @property
+    def explanation_units(self):
+        """Scale of contributions: 'log-odds', 'probability', or None if the model cannot be explained"""
+        if self.is_linear:
+            return 'log-odds'
+        if hasattr(self.model, 'booster_') or hasattr(self.model, 'get_booster') \
+                or hasattr(self.model, 'get_feature_importance'):
+            return 'log-odds'
+        if hasattr(self.model, 'tree_') or hasattr(self.model, 'estimators_'):
+            # Gradient boosting sums raw scores; forests and single trees average probabilities
+            return 'log-odds' if hasattr(self.model, 'init_') else 'probability'
+        return None
+
+    @property
+    def can_explain(self):
+        return self.explanation_units is not None
+
+    def to_matrix(self, X):
+        """Raw feature matrix in bundle feature order"""
+        if hasattr(X, 'columns'):
+            missing = [c for c in self.feature_order if c not in X.columns]
+            if missing:
+                raise BundleError(f"Input is missing features: {missing}")
+            return np.asarray(X[self.feature_order], dtype=np.float64)
+        if isinstance(X, dict):
+            return np.array([[X[c] for c in self.feature_order]], dtype=np.float64)
+
+        X = np.atleast_2d(np.asarray(X, dtype=np.float64))
+        if X.shape[1] != len(self.feature_order):
+            raise BundleError(f"Expected {len(self.feature_order)} features, got {X.shape[1]}")
+        return X
+
+    def transform(self, X):
+        """Standard-scale raw features"""
+        return (self.to_matrix(X) - self.mean) / self.scale
+
+    def decision_function(self, X_scaled):
+        return X_scaled @ self.coef.T + self.intercept
+
+    def predict_proba(self, X):
+        X_scaled = self.transform(X)
+        if not self.is_linear:
+            return self.model.predict_proba(X_scaled)
+
+        scores = self.decision_function(X_scaled)
+        if self.link == 'softmax':
+            return _softmax(scores)
+        ovr = 1.0 / (1.0 + np.exp(-scores))
+        return ovr / ovr.sum(axis=1, keepdims=True)
+
+    def predict(self, X):
+        """Encoded class per row"""
+        return self.classes[np.argmax(self.predict_proba(X), axis=1)]
+
+    def predict_labels(self, X):
+        """Tier name per row"""
+        return [self.class_map[int(c)] for c in self.predict(X)]
+
+    def contributions(self, X):
+        """
+        Per-class, per-feature contributions to the model score (see explanation_units)
+        Returns (contributions (n, classes, features), base (n, classes))
+        Linear models: relative to an average student; boosting libraries: native SHAP values;
+        scikit-learn trees, forests and gradient boosting: decision-path contributions
+        Raises ExplanationUnavailable for other models (e.g. SVM)
+        """
+        X = self.to_matrix(X)
+        if self.is_linear:
+            contrib = X[:, None, :] * self.raw_weights[None, :, :] - self.raw_offsets[None, :, :]
+            base = np.broadcast_to(np.asarray(self.intercept), (len(X), len(self.classes)))
+            return contrib, base
+
+        X_scaled = self.transform(X)
+        n_features = len(self.feature_order)
+        if hasattr(self.model, 'booster_'):  # LightGBM
+            raw = self.model.booster_.predict(X_scaled, pred_contrib=True)
+        elif hasattr(self.model, 'get_booster'):  # XGBoost
+            from xgboost import DMatrix
+            raw = self.model.get_booster().predict(DMatrix(X_scaled), pred_contribs=True)
+        elif hasattr(self.model, 'get_feature_importance'):  # CatBoost
+            from catboost import Pool
+            raw = self.model.get_feature_importance(Pool(X_scaled), type='ShapValues')
+        elif self.can_explain:
+            return self._sklearn_tree_contributions(X_scaled)
+        else:
+            raise ExplanationUnavailable(
+                f"No cheap explanations for {self.manifest.get('model_class', type(self.model).__name__)}"
+            )
+
+        raw = np.asarray(raw).reshape(len(X), len(self.classes), n_features + 1)
+        return raw[:, :, :n_features], raw[:, :, n_features]
+
+    def _sklearn_tree_contributions(self, X_scaled):
+        """Decision-path contributions summed over a scikit-learn tree or ensemble"""
+        model = self.model
+        n_classes = len(self.classes)
+        if hasattr(model, 'tree_'):  # Single decision tree
+            contrib, base = _tree_contributions(model, X_scaled, normalize=True)
+        elif hasattr(model, 'init_'):  # Gradient boosting: one regression tree per class and stage
+            stages = model.estimators_
+            if stages.shape[1] != n_classes:
+                raise ExplanationUnavailable("Binary gradient boosting bundles are not supported")
+            contrib = np.zeros((len(X_scaled), X_scaled.shape[1], n_classes))
+            for stage in stages:
+                for k, tree in enumerate(stage):
+                    contrib[:, :, k] += _tree_contributions(tree, X_scaled, normalize=False)[0][:, :, 0]
+            contrib *= model.learning_rate
+            # Whatever the paths do not explain (initial estimate + root values) is the base
+            base = model.decision_function(X_scaled) - contrib.sum(axis=1)
+            return contrib.transpose(0, 2, 1), base
+        else:  # Random forest / extra trees: average of the trees
+            contrib, base = 0.0, 0.0
+            for tree in model.estimators_:
+                tree_contrib, tree_base = _tree_contributions(tree, X_scaled, normalize=True)
+                contrib = contrib + tree_contrib
+                base = base + tree_base
+            contrib = contrib / len(model.estimators_)
+            base = base / len(model.estimators_)
+        return contrib.transpose(0, 2, 1), np.broadcast_to(base, (len(X_scaled), n_classes))
+
+    def predict_with_explanations(self, X):
+        """
+        Probabilities plus the predicted class's feature contributions, for one or many rows
+        Returns dict of arrays: probabilities, predicted, contributions (n, features), base (n,)
+        """
+        X = self.to_matrix(X)
+        proba = self.predict_proba(X)
+        class_idx = np.argmax(proba, axis=1)
+        contrib, base = self.contributions(X)
+        rows = np.arange(len(X))
+        return {
+            'probabilities': proba,
+            'predicted': self.classes[class_idx],
+            'contributions': contrib[rows, class_idx],
+            'base': base[rows, class_idx],
+        }
+
+    def top_contributions(self, contributions_row, top_k=5):
+        """[(feature, contribution), ...] sorted by absolute impact"""
+        order = np.argsort(-np.abs(contributions_row))[:top_k]
+        return [(self.feature_order[i], round(float(contributions_row[i]), 4)) for i in order]
+
+
+def export_bundle(model, scaler, bundle_dir=BUNDLE_DIR, feature_order=FEATURE_COLUMNS, class_map=CLASS_MAP):
+    """
+    Write a fitted scaler + model as a bundle
+    Returns the manifest dict
+    """
+    feature_order = list(feature_order)
+    scaler_features = getattr(scaler, 'feature_names_in_', None)
+    if scaler_features is not None and list(scaler_features) != feature_order:
+        raise BundleError(f"Scaler was fitted on {list(scaler_features)}, not {feature_order}")
+    if not hasattr(scaler, 'mean_') or not hasattr(scaler, 'scale_'):
+        raise BundleError("Only StandardScaler-style scalers (mean_ / scale_) are supported")
+
+    bundle_dir = Path(bundle_dir)
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+
+    arrays = {
+        'scaler_mean': np.asarray(scaler.mean_, dtype=np.float64),
+        'scaler_scale': np.asarray(scaler.scale_, dtype=np.float64),
+        'classes': np.asarray(model.classes_),
+    }
+
+    link = None
+    if hasattr(model, 'coef_') and hasattr(model, 'predict_proba'):
+        link = _linear_link(model, len(feature_order))
+    if link:
+        model_type = 'linear'
+        arrays['coef'] = np.asarray(model.coef_, dtype=np.float64)
+        arrays['intercept'] = np.asarray(model.intercept_, dtype=np.float64)
+    else:
+        import joblib
+        model_type = 'joblib'
+        joblib.dump(model, bundle_dir / MODEL_FILE)
+
+    files = {}
+    for name, values in arrays.items():
+        file_name = f"{name}.npy"
+        np.save(bundle_dir / file_name, np.ascontiguousarray(values), allow_pickle=False)
+        files[name] = file_name
+    if model_type == 'joblib':
+        files['model'] = MODEL_FILE
+
+    manifest = {
+        'format_version': BUNDLE_FORMAT_VERSION,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'model_class': f"{type(model).__module__}.{type(model).__name__}",
+        'model_type': model_type,
+        'link': link,
+        'feature_order': feature_order,
+        'class_map': {str(k): v for k, v in class_map.items()},
+        'library_versions': _library_versions(),
+        'files': {name: {'path': path, 'sha256': _sha256(bundle_dir / path)} for name, path in files.items()},
+    }
+    with open(bundle_dir / MANIFEST_FILE, 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    print(f"✅ Exported {model_type} bundle ({manifest['model_class']}) -> {bundle_dir}")
+    return manifest
+
+
+def export_from_pickles(model_path='Models/Best_Placement_Model.pkl',
+                        scaler_path='Models/Final_Scaler.pkl', bundle_dir=BUNDLE_DIR):
+    """Convert the legacy pickle pair into a bundle"""
+    with open(model_path, 'rb') as f:
+        model = pickle.load(f)
+    with open(scaler_path, 'rb') as f:
+        scaler = pickle.load(f)
+    return export_bundle(model, scaler, bundle_dir)
+
+
+def load_bundle(bundle_dir=BUNDLE_DIR, expected_features=FEATURE_COLUMNS, verify=True, mmap=True):
+    """
+    Load and validate a bundle
+    Raises BundleError on checksum, format or feature-order mismatch, and
+    when a bundle file is missing or unreadable
+    """
+    try:
+        return _load_bundle(Path(bundle_dir), expected_features, verify, mmap)
+    except BundleError:
+        raise
+    except (OSError, KeyError, ValueError) as e:
+        raise BundleError(f"Bundle at {bundle_dir} could not be read: {e}") from e
+
+
+def _load_bundle(bundle_dir, expected_features, verify, mmap):
+    manifest_path = bundle_dir / MANIFEST_FILE
+    if not manifest_path.exists():
+        raise BundleError(f"No bundle manifest at {manifest_path}")
+    with open(manifest_path, 'r') as f:
+        manifest = json.load(f)
+
+    if manifest.get('format_version') != BUNDLE_FORMAT_VERSION:
+        raise BundleError(f"Unsupported bundle format: {manifest.get('format_version')}")
+    if expected_features is not None and manifest['feature_order'] != list(expected_features):
+        raise BundleError(f"Feature order mismatch: bundle has {manifest['feature_order']}")
+
+    files = manifest['files']
+    if verify:
+        for name, entry in files.items():
+            if _sha256(bundle_dir / entry['path']) != entry['sha256']:
+                raise BundleError(f"Checksum mismatch for {entry['path']}")
+
+    mmap_mode = 'r' if mmap else None
+
+    def array(name):
+        return np.load(bundle_dir / files[name]['path'], mmap_mode=mmap_mode, allow_pickle=False)
+
+    model = None
+    if manifest['model_type'] == 'joblib':
+        import joblib
+        built_with = manifest['library_versions'].get('scikit-learn')
+        current = _library_versions().get('scikit-learn')
+        if built_with and current and built_with.split('.')[:2] != current.split('.')[:2]:
+            print(f"⚠️  Bundle built with scikit-learn {built_with}, running {current}")
+        model = joblib.load(bundle_dir / files['model']['path'], mmap_mode=mmap_mode)
+        if mmap_mode:
+            # Some estimators (e.g. libsvm-backed SVC) reject read-only memory-mapped arrays
+            try:
+                model.predict_proba(np.zeros((1, len(manifest['feature_order']))))
+            except ValueError:
+                model = joblib.load(bundle_dir / files['model']['path'])
+
+    return PlacementPredictor(
+        feature_order=manifest['feature_order'],
+        class_map={int(k): v for k, v in manifest['class_map'].items()},
+        mean=array('scaler_mean'),
+        scale=array('scaler_scale'),
+        classes=np.asarray(array('classes')),
+        coef=array('coef') if 'coef' in files else None,
+        intercept=array('intercept') if 'intercept' in files else None,
+        link=manifest.get('link'),
+        model=model,
+        manifest=manifest,
+    )
+
+
+def get_predictor(bundle_dir=BUNDLE_DIR):
+    """
+    Process-wide cached bundle
+    Load before forking workers so they share the mapped weights
+    """
+    key = str(Path(bundle_dir).resolve())
+    if key not in _PREDICTOR_CACHE:
+        _PREDICTOR_CACHE[key] = load_bundle(bundle_dir)
+    return _PREDICTOR_CACHE[key]
+
+
+# Command line entry point
+if __name__ == "__main__":
+    if len(sys.argv) == 4:
+        export_from_pickles(sys.argv[1], sys.argv[2], sys.argv[3])
+        bundle_dir = sys.argv[3]
+    else:
+        export_from_pickles()
+        bundle_dir = BUNDLE_DIR
+
+    predictor = load_bundle(bundle_dir)
+    sample = {c: v for c, v in zip(FEATURE_COLUMNS, [85, 80, 8.5, 1, 1, 1, 4, 1, 60])}
+    print(f"🎯 Sample prediction: {predictor.predict_labels(sample)[0]}")
@@ -0,0 +1,273 @@
+"""
+Model Training Pipeline
+Scriptable version of Notebooks/05_Machine_Learning_Models.ipynb
+Scales + SMOTE-balances the training split (memoized on disk by data hash),
+grid-searches every model family in a process pool and writes the
+scaler, best model (pickles + artifact bundle) and a metrics report
+
+Usage: python -m src.Model_Training_11 [--output-dir Models] [--workers 4]
+"""
+
+import json
+import time
+import pickle
+import hashlib
+import argparse
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+from sklearn.model_selection import train_test_split, GridSearchCV, StratifiedKFold
+from sklearn.preprocessing import StandardScaler
+from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score, confusion_matrix
+
+from src.Dataset_Store_10 import load_or_convert
+from src.Model_Artifacts_12 import export_bundle
+from src.Records_09 import FEATURE_COLUMNS, TARGET_COLUMN, CLASS_MAP
+
+
+DATASET_PATH = 'Datasets/Placement_Dataset_Preprocessed.csv'
+CACHE_DIR = '.cache/training'
+TEST_SIZE = 0.2
+RANDOM_STATE = 42
+CV_FOLDS = 5
+SCORING = 'f1_weighted'
+
+
+def _logistic_regression():
+    from sklearn.linear_model import LogisticRegression
+    return LogisticRegression(max_iter=2000, random_state=RANDOM_STATE), {'C': [0.01, 0.1, 1, 10, 100]}
+
+
+def _svm():
+    from sklearn.svm import SVC
+    return SVC(probability=True, random_state=RANDOM_STATE), {'C': [0.1, 1, 10], 'kernel': ['linear', 'rbf']}
+
+
+def _decision_tree():
+    from sklearn.tree import DecisionTreeClassifier
+    return DecisionTreeClassifier(random_state=RANDOM_STATE), {'max_depth': [3, 5, 8, None], 'min_samples_leaf': [1, 3, 5]}
+
+
+def _random_forest():
+    from sklearn.ensemble import RandomForestClassifier
+    return RandomForestClassifier(random_state=RANDOM_STATE, n_jobs=1), {'n_estimators': [100, 300], 'max_depth': [5, 10, None]}
+
+
+def _gradient_boosting():
+    from sklearn.ensemble import GradientBoostingClassifier
+    return GradientBoostingClassifier(random_state=RANDOM_STATE), {'n_estimators': [100, 200], 'learning_rate': [0.05, 0.1], 'max_depth': [2, 3]}
+
+
+def _xgboost():
+    from xgboost import XGBClassifier
+    return XGBClassifier(random_state=RANDOM_STATE, n_jobs=1, eval_metric='mlogloss'), {'n_estimators': [100, 300], 'max_depth': [3, 5], 'learning_rate': [0.05, 0.1]}
+
+
+def _lightgbm():
+    from lightgbm import LGBMClassifier
+    return LGBMClassifier(random_state=RANDOM_STATE, n_jobs=1, verbose=-1), {'n_estimators': [100, 300], 'num_leaves': [15, 31], 'learning_rate': [0.05, 0.1]}
+
+
+def _catboost():
+    from catboost import CatBoostClassifier
+    return CatBoostClassifier(random_state=RANDOM_STATE, thread_count=1, verbose=0), {'iterations': [200, 500], 'depth': [4, 6]}
+
+
+# Model family -> factory returning (estimator, param_grid)
+# Factories import lazily so missing optional libraries only skip that family
+MODEL_FAMILIES = {
+    'Logistic Regression': _logistic_regression,
+    'SVM': _svm,
+    'Decision Tree': _decision_tree,
+    'Random Forest': _random_forest,
+    'Gradient Boosting': _gradient_boosting,
+    'XGBoost': _xgboost,
+    'LightGBM': _lightgbm,
+    'CatBoost': _catboost,
+}
+
+
+def load_training_data(dataset_path=DATASET_PATH):
+    """Load features and target through the columnar dataset store"""
+    df = load_or_convert(dataset_path, columns=FEATURE_COLUMNS + [TARGET_COLUMN], decode=False)
+    X = df[FEATURE_COLUMNS].astype(np.float64)
+    y = np.asarray(df[TARGET_COLUMN], dtype=np.int64)
+    return X, y
+
+
+def data_hash(X, y, use_smote):
+    """Cache key covering the data and every preprocessing setting"""
+    digest = hashlib.sha256()
+    digest.update(json.dumps(list(X.columns)).encode())
+    digest.update(np.ascontiguousarray(X.to_numpy()).tobytes())
+    digest.update(np.ascontiguousarray(y).tobytes())
+    digest.update(json.dumps([TEST_SIZE, RANDOM_STATE, use_smote]).encode())
+    return digest.hexdigest()[:16]
+
+
+def preprocess(X, y, use_smote=True):
+    """Split, scale and (optionally) SMOTE-balance the training set"""
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=TEST_SIZE, random_state=RANDOM_STATE, stratify=y
+    )
+
+    # Fit on a DataFrame so the scaler keeps feature_names_in_ for app.py
+    scaler = StandardScaler()
+    X_train_scaled = scaler.fit_transform(X_train)
+    X_test_scaled = scaler.transform(X_test)
+
+    if use_smote:
+        try:
+            from imblearn.over_sampling import SMOTE
+            X_train_scaled, y_train = SMOTE(random_state=RANDOM_STATE).fit_resample(X_train_scaled, y_train)
+        except ImportError:
+            print("⚠️  imbalanced-learn not installed, training without SMOTE")
+
+    return {
+        'scaler': scaler,
+        'X_train': X_train_scaled,
+        'y_train': np.asarray(y_train),
+        'X_test': X_test_scaled,
+        'y_test': np.asarray(y_test),
+    }
+
+
+def load_or_preprocess(X, y, use_smote=True, cache_dir=CACHE_DIR):
+    """
+    Memoized preprocess(): reuses the on-disk result for identical data
+    Returns (cache_path, prepared)
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_path = cache_dir / f"prepared_{data_hash(X, y, use_smote)}.pkl"
+
+    if cache_path.exists():
+        print(f"♻️  Reusing cached preprocessing: {cache_path}")
+        with open(cache_path, 'rb') as f:
+            return cache_path, pickle.load(f)
+
+    prepared = preprocess(X, y, use_smote)
+    tmp_path = cache_path.with_suffix('.tmp')
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(prepared, f)
+    tmp_path.replace(cache_path)
+    print(f"✅ Preprocessed {len(prepared['y_train'])} training rows -> {cache_path}")
+    return cache_path, prepared
+
+
+def evaluate(model, X_test, y_test):
+    """Test-set metrics for one fitted model"""
+    y_pred = model.predict(X_test)
+    return {
+        'accuracy': accuracy_score(y_test, y_pred),
+        'precision': precision_score(y_test, y_pred, average='weighted', zero_division=0),
+        'recall': recall_score(y_test, y_pred, average='weighted', zero_division=0),
+        'f1_score': f1_score(y_test, y_pred, average='weighted', zero_division=0),
+        'confusion_matrix': confusion_matrix(y_test, y_pred, labels=sorted(CLASS_MAP)).tolist(),
+    }
+
+
+def train_family(family, cache_path):
+    """
+    Grid-search one model family (runs inside a worker process)
+    Workers read the prepared data from the cache file instead of receiving it
+    """
+    with open(cache_path, 'rb') as f:
+        prepared = pickle.load(f)
+
+    start = time.perf_counter()
+    estimator, param_grid = MODEL_FAMILIES[family]()
+    search = GridSearchCV(
+        estimator,
+        param_grid,
+        scoring=SCORING,
+        cv=StratifiedKFold(n_splits=CV_FOLDS, shuffle=True, random_state=RANDOM_STATE),
+        n_jobs=1,
+    )
+    search.fit(prepared['X_train'], prepared['y_train'])
+
+    metrics = evaluate(search.best_estimator_, prepared['X_test'], prepared['y_test'])
+    metrics.update({
+        'cv_score': search.best_score_,
+        'best_params': search.best_params_,
+        'train_seconds': round(time.perf_counter() - start, 2),
+    })
+    return family, search.best_estimator_, metrics
+
+
+def run_training(dataset_path=DATASET_PATH, output_dir='Models', families=None,
+                 workers=None, use_smote=True, cache_dir=CACHE_DIR):
+    """
+    Full pipeline: load, preprocess (cached), parallel model search, save artifacts
+    Returns the metrics report dict
+    """
+    families = families or list(MODEL_FAMILIES)
+    unknown = [f for f in families if f not in MODEL_FAMILIES]
+    if unknown:
+        raise ValueError(f"Unknown model families: {unknown}")
+
+    X, y = load_training_data(dataset_path)
+    cache_path, prepared = load_or_preprocess(X, y, use_smote, cache_dir)
+
+    print(f"🧠 Training {len(families)} model families...")
+    results, models, skipped = {}, {}, {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(train_family, family, cache_path): family for family in families}
+        for future in as_completed(futures):
+            family = futures[future]
+            try:
+                _, model, metrics = future.result()
+            except ImportError as e:
+                skipped[family] = str(e)
+                print(f"⚠️  {family}: skipped ({e})")
+                continue
+            models[family] = model
+            results[family] = metrics
+            print(f"✅ {family}: CV {metrics['cv_score']:.4f} | Test accuracy {metrics['accuracy']:.4f}")
+
+    if not results:
+        raise RuntimeError("No model family could be trained")
+
+    # Select on cross-validation score; the test split is only reported
+    best_family = max(results, key=lambda f: results[f]['cv_score'])
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with open(output_dir / 'Best_Placement_Model.pkl', 'wb') as f:
+        pickle.dump(models[best_family], f)
+    with open(output_dir / 'Final_Scaler.pkl', 'wb') as f:
+        pickle.dump(prepared['scaler'], f)
+    export_bundle(models[best_family], prepared['scaler'], output_dir / 'Placement_Bundle')
+
+    report = {
+        'dataset': str(dataset_path),
+        'data_hash': cache_path.stem.replace('prepared_', ''),
+        'features': FEATURE_COLUMNS,
+        'class_map': {str(k): v for k, v in CLASS_MAP.items()},
+        'smote': use_smote,
+        'scoring': SCORING,
+        'best_model': best_family,
+        'models': results,
+        'skipped': skipped,
+    }
+    with open(output_dir / 'Training_Report.json', 'w') as f:
+        json.dump(report, f, indent=2, default=float)
+
+    print(f"\n🏆 Best model: {best_family} (CV {results[best_family]['cv_score']:.4f})")
+    print(f"💾 Saved model, scaler and report to {output_dir}")
+    return report
+
+
+# Command line entry point
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train and select the placement model")
+    parser.add_argument('--dataset', default=DATASET_PATH)
+    parser.add_argument('--output-dir', default='Models')
+    parser.add_argument('--families', nargs='+', choices=list(MODEL_FAMILIES), help="Model families to search")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--no-smote', action='store_true')
+    parser.add_argument('--cache-dir', default=CACHE_DIR)
+    args = parser.parse_args()
+
+    run_training(args.dataset, args.output_dir, args.families, args.workers, not args.no_smote, args.cache_dir)
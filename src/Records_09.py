@@ -0,0 +1,181 @@
+"""
+Typed Records
+Compact __slots__ records for parsed resumes and job match results
+Display fields are formatted lazily; records convert cheaply to dicts,
+column batches or Arrow tables for the UI and exports
+Also holds the feature schema shared by training and prediction
+"""
+
+from dataclasses import dataclass, field, fields
+
+
+# Model input columns, in the order the scaler and model were fitted on
+FEATURE_COLUMNS = [
+    '10th marks',
+    '12th marks',
+    'Cgpa',
+    'Internships(Y/N)',
+    'Training(Y/N)',
+    'Innovative Project(Y/N)',
+    'Communication level',
+    'Technical Course(Y/N)',
+    'Technical_Skills_Score',
+]
+
+TARGET_COLUMN = 'Package_Category'
+
+# Encoded Package_Category -> tier name
+CLASS_MAP = {0: 'Basic', 1: 'Not Placed', 2: 'Premium', 3: 'Standard'}
+
+# Parsed resume / student profile key -> model feature
+PROFILE_FEATURES = {
+    'tenth_marks': '10th marks',
+    'twelfth_marks': '12th marks',
+    'cgpa': 'Cgpa',
+    'internships': 'Internships(Y/N)',
+    'training': 'Training(Y/N)',
+    'projects': 'Innovative Project(Y/N)',
+    'communication_level': 'Communication level',
+    'technical_course': 'Technical Course(Y/N)',
+    'technical_skills_score': 'Technical_Skills_Score',
+}
+
+
+def profile_to_features(profile):
+    """Model feature row (list in FEATURE_COLUMNS order) from a parsed resume or profile"""
+    values = {PROFILE_FEATURES[key]: float(profile[key]) for key in PROFILE_FEATURES}
+    return [values[col] for col in FEATURE_COLUMNS]
+
+
+@dataclass(slots=True)
+class ParsedResume:
+    """Information extracted from one resume by the NLP parser"""
+    email: str = None
+    phone: str = None
+    name: str = 'Unknown'
+    organizations: list = field(default_factory=list)
+    locations: list = field(default_factory=list)
+    cgpa: float = 7.0
+    tenth_marks: float = 75.0
+    twelfth_marks: float = 75.0
+    skills: list = field(default_factory=list)
+    internships: int = 0
+    projects: int = 0
+    training: int = 0
+    technical_course: int = 0
+    communication_level: int = 3
+    technical_skills_score: int = 30
+
+    def __getitem__(self, key):
+        # Read access like the dicts returned before records existed
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        # The matcher and scorer read optional keys with .get, as on profile dicts
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in _field_names(ParsedResume)}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{name: data[name] for name in _field_names(cls) if name in data})
+
+
+@dataclass(slots=True)
+class MatchResult:
+    """Match between one student and one company"""
+    company: str
+    role: str
+    location: str
+    package_min: float
+    package_max: float
+    package_category: str
+    match_score: float
+    skills_required: list
+    skills_matched: list
+    cgpa_required: float
+    meets_cgpa: bool
+    focus: str
+
+    @property
+    def package(self):
+        return f"₹{self.package_min}-{self.package_max} LPA"
+
+    @property
+    def skills_gap(self):
+        matched = {m.lower() for m in self.skills_matched}
+        return [s for s in self.skills_required if s.lower() not in matched]
+
+    def __getitem__(self, key):
+        if key in MATCH_FIELDS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def to_dict(self):
+        """Same keys and values as the original get_top_matches dicts"""
+        return {name: getattr(self, name) for name in MATCH_FIELDS}
+
+
+# Keys exposed by MatchResult.to_dict(), in display order
+MATCH_FIELDS = (
+    'company', 'role', 'location', 'package', 'package_category', 'match_score',
+    'skills_required', 'skills_matched', 'skills_gap', 'cgpa_required', 'meets_cgpa', 'focus',
+)
+
+
+def _field_names(cls):
+    return [f.name for f in fields(cls)]
+
+
+def records_to_dicts(records):
+    """Convert a list of records to plain dicts"""
+    return [r.to_dict() for r in records]
+
+
+def records_to_columns(records, columns=None):
+    """
+    Convert records to a dict of column lists
+    Only the requested columns are materialized
+    """
+    records = list(records)
+    if columns is None:
+        if not records:
+            return {}
+        columns = MATCH_FIELDS if isinstance(records[0], MatchResult) else _field_names(type(records[0]))
+    return {col: [getattr(r, col) for r in records] for col in columns}
+
+
+def records_to_arrow(records, columns=None):
+    """Convert records to a pyarrow Table (requires pyarrow)"""
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError("pyarrow is required for Arrow export: pip install pyarrow") from None
+    return pa.table(records_to_columns(records, columns))
+
+
+# Test function
+if __name__ == "__main__":
+    from src.Job_Matcher_06 import get_top_matches
+
+    record = ParsedResume(cgpa=8.2, tenth_marks=88, twelfth_marks=84, skills=['Python', 'SQL', 'Machine Learning'],
+                          internships=1, projects=1, technical_skills_score=70)
+    profile = record.to_dict()
+    assert ParsedResume.from_dict(profile) == record
+    assert record['cgpa'] == 8.2 and record.get('skills') == profile['skills']
+    assert record.get('salary') is None and record.get('salary', 0) == 0
+    assert profile_to_features(record) == profile_to_features(profile)
+    print("✅ ParsedResume reads like a profile dict")
+
+    # The matcher accepts records wherever it accepted parsed-resume dicts
+    from_record = get_top_matches(record, 'Standard', top_n=5)
+    from_dict = get_top_matches(profile, 'Standard', top_n=5)
+    assert from_record == from_dict, "record and dict profiles match differently"
+    print(f"✅ get_top_matches gives the same {len(from_record)} matches for a record and its dict")
@@ -0,0 +1,275 @@
+"""
+Near-Duplicate Resume Detection
+Fingerprints extracted resume text with MinHash and indexes the
+fingerprints with LSH, so re-uploads of an already parsed resume
+reuse the cached NLP parse instead of running spaCy again
+"""
+
+import re
+import json
+import hashlib
+from pathlib import Path
+
+import numpy as np
+
+from src.Resume_Parser_07 import (
+    extract_text_from_pdf,
+    extract_email_phone,
+    extract_cgpa_regex,
+    extract_marks_nlp,
+    parse_resume_text,
+)
+
+
+NUM_PERM = 128          # MinHash signature length
+NUM_BANDS = 16          # LSH bands (NUM_PERM / NUM_BANDS rows per band)
+SHINGLE_SIZE = 3        # Word shingles
+DUPLICATE_THRESHOLD = 0.9
+
+_MERSENNE_PRIME = (1 << 31) - 1
+
+
+def _permutations(num_perm, seed=42):
+    """Fixed hash permutations so fingerprints stay comparable across runs"""
+    rng = np.random.RandomState(seed)
+    a = rng.randint(1, _MERSENNE_PRIME, size=num_perm, dtype=np.int64).astype(np.uint64)
+    b = rng.randint(0, _MERSENNE_PRIME, size=num_perm, dtype=np.int64).astype(np.uint64)
+    return a, b
+
+
+_PERM_A, _PERM_B = _permutations(NUM_PERM)
+
+
+def normalize_text(text):
+    """Lowercase and collapse whitespace/punctuation so trivial edits do not matter"""
+    text = text.lower()
+    text = re.sub(r'[^a-z0-9@.+%]+', ' ', text)
+    return text.strip()
+
+
+def get_shingles(text, size=SHINGLE_SIZE):
+    """Set of word n-grams from normalized text"""
+    words = normalize_text(text).split()
+    if len(words) < size:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def compute_minhash(text, num_perm=NUM_PERM):
+    """
+    MinHash signature of resume text
+    Returns uint64 array of length num_perm
+    """
+    shingles = get_shingles(text)
+    if num_perm == NUM_PERM:
+        perm_a, perm_b = _PERM_A, _PERM_B
+    else:
+        perm_a, perm_b = _permutations(num_perm)
+
+    if not shingles:
+        return np.full(num_perm, _MERSENNE_PRIME, dtype=np.uint64)
+
+    # 31-bit base hash per shingle keeps a*x+b inside uint64
+    base = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=4).digest(), 'little') & _MERSENNE_PRIME
+         for s in shingles),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+    hashed = (perm_a[:, None] * base[None, :] + perm_b[:, None]) % _MERSENNE_PRIME
+    return hashed.min(axis=1)
+
+
+def estimate_similarity(sig_a, sig_b):
+    """Estimated Jaccard similarity between two MinHash signatures"""
+    return float(np.mean(sig_a == sig_b))
+
+
+class ResumeDedupIndex:
+    """
+    LSH index over MinHash signatures of previously parsed resumes
+    Keeps the cached parse for every indexed resume
+    """
+
+    def __init__(self, threshold=DUPLICATE_THRESHOLD, num_perm=NUM_PERM, num_bands=NUM_BANDS):
+        if num_perm % num_bands != 0:
+            raise ValueError("num_perm must be divisible by num_bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.num_bands = num_bands
+        self.rows = num_perm // num_bands
+        self.buckets = [dict() for _ in range(num_bands)]
+        self.signatures = {}
+        self.parses = {}
+
+    def __len__(self):
+        return len(self.signatures)
+
+    def _band_keys(self, signature):
+        for band in range(self.num_bands):
+            chunk = signature[band * self.rows:(band + 1) * self.rows]
+            yield band, chunk.tobytes()
+
+    def add(self, key, signature, parsed):
+        """Index a parsed resume under key"""
+        if key in self.signatures:
+            self.remove(key)
+        self.signatures[key] = signature
+        self.parses[key] = parsed
+        for band, band_key in self._band_keys(signature):
+            self.buckets[band].setdefault(band_key, set()).add(key)
+
+    def remove(self, key):
+        """Drop a resume from the index"""
+        signature = self.signatures.pop(key, None)
+        self.parses.pop(key, None)
+        if signature is None:
+            return
+        for band, band_key in self._band_keys(signature):
+            bucket = self.buckets[band].get(band_key)
+            if bucket:
+                bucket.discard(key)
+                if not bucket:
+                    del self.buckets[band][band_key]
+
+    def candidates(self, signature):
+        """Keys sharing at least one LSH band with the signature"""
+        found = set()
+        for band, band_key in self._band_keys(signature):
+            found.update(self.buckets[band].get(band_key, ()))
+        return found
+
+    def query(self, signature):
+        """
+        Find the closest indexed resume above the threshold
+        Returns (key, similarity) or None
+        """
+        best_key, best_sim = None, 0.0
+        for key in self.candidates(signature):
+            sim = estimate_similarity(signature, self.signatures[key])
+            if sim > best_sim:
+                best_key, best_sim = key, sim
+        if best_key is not None and best_sim >= self.threshold:
+            return best_key, best_sim
+        return None
+
+    def save(self, path):
+        """Persist signatures and cached parses to a JSON file"""
+        data = {
+            'threshold': self.threshold,
+            'num_perm': self.num_perm,
+            'num_bands': self.num_bands,
+            'entries': [
+                {'key': key, 'signature': self.signatures[key].tolist(), 'parsed': self.parses[key]}
+                for key in self.signatures
+            ],
+        }
+        with open(path, 'w') as f:
+            json.dump(data, f)
+
+    @classmethod
+    def load(cls, path):
+        """Load an index written by save()"""
+        with open(path, 'r') as f:
+            data = json.load(f)
+        index = cls(data['threshold'], data['num_perm'], data['num_bands'])
+        for entry in data['entries']:
+            signature = np.array(entry['signature'], dtype=np.uint64)
+            index.add(entry['key'], signature, entry['parsed'])
+        return index
+
+
+def refresh_cheap_fields(cached, text):
+    """
+    Reuse a cached parse for a near-duplicate resume
+    Contact details, marks and CGPA are re-extracted from the new text with the
+    parser's regexes; every field that differs from the cached parse is reported
+    Returns (parsed, changed_fields)
+    """
+    parsed = dict(cached)
+    email, phone = extract_email_phone(text)
+    tenth_marks, twelfth_marks = extract_marks_nlp(None, text)
+    fresh = {
+        'email': email,
+        'phone': phone,
+        'cgpa': extract_cgpa_regex(text),
+        'tenth_marks': tenth_marks,
+        'twelfth_marks': twelfth_marks,
+    }
+
+    changed_fields = [field for field, value in fresh.items() if parsed.get(field) != value]
+    parsed.update(fresh)
+    return parsed, changed_fields
+
+
+def find_duplicate(index, signature, text):
+    """
+    Look up a near-duplicate and build the reused parse
+    Resumes with a different email are never treated as duplicates, and a
+    changed CGPA (which the full parser also reads from sentence context)
+    falls back to the full NLP parse
+    Returns (key, similarity, parsed, changed_fields) or None
+    """
+    match = index.query(signature)
+    if not match:
+        return None
+    dup_key, similarity = match
+    cached = index.parses[dup_key]
+    parsed, changed_fields = refresh_cheap_fields(cached, text)
+    if 'email' in changed_fields and cached.get('email') and parsed['email']:
+        return None
+    if 'cgpa' in changed_fields:
+        return None
+    return dup_key, similarity, parsed, changed_fields
+
+
+def parse_resumes_bulk(pdf_paths, index=None, threshold=DUPLICATE_THRESHOLD):
+    """
+    Parse a batch of resumes, skipping NLP for near-duplicates
+    Returns list of dicts with file, parsed data and duplicate flags
+    """
+    if index is None:
+        index = ResumeDedupIndex(threshold=threshold)
+
+    results = []
+    for pdf_path in pdf_paths:
+        key = str(pdf_path)
+        text = extract_text_from_pdf(pdf_path)
+        if not text:
+            results.append({'file': key, 'data': None, 'duplicate_of': None, 'similarity': None, 'changed_fields': []})
+            continue
+
+        signature = compute_minhash(text, index.num_perm)
+        match = find_duplicate(index, signature, text)
+
+        if match:
+            dup_key, similarity, parsed, changed_fields = match
+            print(f"♻️  {Path(key).name}: near-duplicate of {Path(dup_key).name} ({similarity:.0%}), NLP skipped")
+            results.append({
+                'file': key,
+                'data': parsed,
+                'duplicate_of': dup_key,
+                'similarity': round(similarity, 3),
+                'changed_fields': changed_fields,
+            })
+        else:
+            parsed = parse_resume_text(text)
+            index.add(key, signature, parsed)
+            results.append({'file': key, 'data': parsed, 'duplicate_of': None, 'similarity': None, 'changed_fields': []})
+
+    duplicates = sum(1 for r in results if r['duplicate_of'])
+    print(f"\n✅ Parsed {len(results)} resumes | ♻️  {duplicates} near-duplicates reused cached parse")
+    return results
+
+
+# Test function
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1:
+        results = parse_resumes_bulk(sys.argv[1:])
+        for r in results:
+            flag = f"DUPLICATE of {r['duplicate_of']}" if r['duplicate_of'] else "parsed"
+            print(f"   - {r['file']}: {flag}")
+    else:
+        print("Usage: python -m src.Resume_Dedup_08 <resume1.pdf> <resume2.pdf> ...")
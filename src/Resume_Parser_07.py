@@ -5,24 +5,35 @@ POS tagging, dependency parsing, and semantic similarity
 """
 
 import re
-import PyPDF2
-import pdfplumber
 from pathlib import Path
-import spacy
-from spacy.matcher import Matcher, PhraseMatcher
 from collections import Counter
 
-# Load spaCy model (install with: python -m spacy download en_core_web_md)
-try:
-    nlp = spacy.load("en_core_web_md")
-except:
-    print("⚠️  Installing spaCy model...")
-    import os
-    os.system("python -m spacy download en_core_web_md")
-    nlp = spacy.load("en_core_web_md")
+from src.Records_09 import ParsedResume
+
+# spaCy and the PDF libraries are imported on first use so that importing this
+# module (e.g. for the regex helpers) stays cheap
+_NLP = None
+
+
+def get_nlp():
+    """Load the spaCy model once per process (install with: python -m spacy download en_core_web_md)"""
+    global _NLP
+    if _NLP is None:
+        import spacy
+        try:
+            _NLP = spacy.load("en_core_web_md")
+        except:
+            print("⚠️  Installing spaCy model...")
+            import os
+            os.system("python -m spacy download en_core_web_md")
+            _NLP = spacy.load("en_core_web_md")
+    return _NLP
 
 def extract_text_from_pdf(pdf_path):
     """Extract text from PDF using multiple methods"""
+    import PyPDF2
+    import pdfplumber
+    
     text = ""
     
     try:
@@ -72,8 +83,8 @@ def extract_email_phone(text):
     
     return emails[0] if emails else None, phones[0] if phones else None
 
-def extract_cgpa_nlp(doc, text):
-    """Extract CGPA using NLP context understanding + robust regex"""
+def _cgpa_candidates(text, sentences):
+    """CGPA values found by the regex patterns and in sentences mentioning a grade term"""
     cgpa_values = []
     
     # More robust regex patterns with dash support
@@ -95,8 +106,8 @@ def extract_cgpa_nlp(doc, text):
                 cgpa_values.append(val)
     
     # Also look through sentences for context
-    for sent in doc.sents:
-        sent_text = sent.text.lower()
+    for sent_text in sentences:
+        sent_text = sent_text.lower()
         if any(term in sent_text for term in ['cgpa', 'gpa', 'cpi', 'grade point']):
             # Extract numbers using regex from this specific sentence
             numbers = re.findall(r'\b([0-9]\.[0-9]+)\b', sent_text)
@@ -105,6 +116,16 @@ def extract_cgpa_nlp(doc, text):
                 if 0 <= val <= 10:
                     cgpa_values.append(val)
     
+    return cgpa_values
+
+def extract_cgpa_nlp(doc, text):
+    """Extract CGPA using NLP context understanding + robust regex"""
+    cgpa_values = _cgpa_candidates(text, (sent.text for sent in doc.sents))
+    return max(cgpa_values) if cgpa_values else 7.0
+
+def extract_cgpa_regex(text):
+    """CGPA without spaCy: same patterns, with lines standing in for sentences"""
+    cgpa_values = _cgpa_candidates(text, text.splitlines())
     return max(cgpa_values) if cgpa_values else 7.0
 
 
@@ -168,6 +189,8 @@ def extract_skills_nlp(doc):
     ]
     
     # Create PhraseMatcher
+    from spacy.matcher import PhraseMatcher
+    nlp = get_nlp()
     matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
     patterns = [nlp.make_doc(skill) for skill in skill_patterns]
     matcher.add("SKILLS", patterns)
@@ -298,10 +321,10 @@ def estimate_tech_skills_nlp(skills_list, doc):
     
     return min(base_score, 100)
 
-def parse_resume(pdf_path):
+def parse_resume(pdf_path, as_record=False):
     """
     Main function to parse resume using NLP
-    Returns dict with extracted information
+    Returns dict with extracted information, or a ParsedResume if as_record is True
     """
     print(f"\n{'='*60}")
     print(f"📄 PARSING RESUME WITH NLP: {Path(pdf_path).name}")
@@ -314,11 +337,18 @@ def parse_resume(pdf_path):
         print("❌ Could not extract text from PDF!")
         return None
     
+    return parse_resume_text(text, as_record=as_record)
+
+def parse_resume_text(text, as_record=False):
+    """
+    Run the NLP extraction on already extracted resume text
+    Returns dict with extracted information, or a ParsedResume if as_record is True
+    """
     print(f"✅ Extracted {len(text)} characters")
     print(f"🧠 Processing with spaCy NLP...")
     
     # Process with spaCy
-    doc = nlp(text)
+    doc = get_nlp()(text)
     
     print(f"✅ Identified {len(list(doc.sents))} sentences")
     print(f"✅ Found {len(doc.ents)} named entities")
@@ -338,28 +368,28 @@ def parse_resume(pdf_path):
     tech_score = estimate_tech_skills_nlp(skills, doc)
     
     # Compile results
-    extracted_data = {
-        'email': email,
-        'phone': phone,
-        'name': entities['PERSON'][0] if entities['PERSON'] else 'Unknown',
-        'organizations': entities['ORG'][:3] if entities['ORG'] else [],
-        'locations': entities['GPE'][:3] if entities['GPE'] else [],
-        'cgpa': cgpa,
-        'tenth_marks': tenth_marks,
-        'twelfth_marks': twelfth_marks,
-        'skills': skills,
-        'internships': experience['internships'],
-        'projects': experience['projects'],
-        'training': experience['training'],
-        'technical_course': experience['technical_course'],
-        'communication_level': communication,
-        'technical_skills_score': tech_score
-    }
+    extracted_data = ParsedResume(
+        email=email,
+        phone=phone,
+        name=entities['PERSON'][0] if entities['PERSON'] else 'Unknown',
+        organizations=entities['ORG'][:3] if entities['ORG'] else [],
+        locations=entities['GPE'][:3] if entities['GPE'] else [],
+        cgpa=cgpa,
+        tenth_marks=tenth_marks,
+        twelfth_marks=twelfth_marks,
+        skills=skills,
+        internships=experience['internships'],
+        projects=experience['projects'],
+        training=experience['training'],
+        technical_course=experience['technical_course'],
+        communication_level=communication,
+        technical_skills_score=tech_score
+    )
     
     # Display results
     print(f"\n📊 EXTRACTED INFORMATION (NLP-BASED):")
     print(f"{'='*60}")
-    print(f"👤 Name: {extracted_data['name']}")
+    print(f"👤 Name: {extracted_data.name}")
     print(f"📧 Email: {email or 'Not found'}")
     print(f"📱 Phone: {phone or 'Not found'}")
     if entities['ORG']:
@@ -380,7 +410,9 @@ def parse_resume(pdf_path):
         print(f"   ... and {len(skills)-15} more")
     print(f"{'='*60}\n")
     
-    return extracted_data
+    if as_record:
+        return extracted_data
+    return extracted_data.to_dict()
 
 # Test function
 if __name__ == "__main__":
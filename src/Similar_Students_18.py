@@ -0,0 +1,257 @@
+"""
+Similar Students Lookup
+KD-tree over the scaled feature space of past students, so a prediction can
+be shown next to the k most similar historical profiles and their outcomes
+New cohorts go into a small delta buffer that is searched by brute force;
+the tree is rebuilt only when the buffer grows past a fraction of the index
+Rows appended to the datasets, or added with append_students(), are applied
+to the persisted index without rebuilding it from scratch
+
+Usage: python -m src.Similar_Students_18 [--rebuild]
+"""
+
+import json
+import pickle
+import hashlib
+from pathlib import Path
+
+import numpy as np
+from sklearn.neighbors import KDTree
+
+from src.Dataset_Store_10 import load_or_convert, file_sha256
+from src.Model_Artifacts_12 import get_predictor
+from src.Records_09 import FEATURE_COLUMNS, TARGET_COLUMN, CLASS_MAP
+
+
+FEATURES_PATH = 'Datasets/Placement_Dataset_Preprocessed.csv'
+OUTCOMES_PATH = 'Datasets/Placement_Dataset_EDA.csv'
+INDEX_PATH = '.cache/neighbors/Student_Neighbors.pkl'
+REBUILD_FRACTION = 0.1   # Rebuild once the delta buffer exceeds 10% of the tree
+LEAF_SIZE = 16
+
+# Where each indexed row came from
+FROM_DATASET = 0
+FROM_APPEND = 1
+
+
+def bundle_fingerprint(predictor):
+    """Hash of every file in the model bundle manifest (scaler mean, scale, weights, ...)"""
+    files = predictor.manifest.get('files', {})
+    return hashlib.sha256(json.dumps(files, sort_keys=True).encode()).hexdigest()
+
+
+class SimilarStudentsIndex:
+    """Nearest past students in the model's scaled feature space"""
+
+    def __init__(self, features, categories, salaries, predictor=None, origin=None):
+        self.predictor = predictor or get_predictor()
+        self.features = np.asarray(features, dtype=np.float64)
+        self.categories = np.asarray(categories, dtype=np.int64)
+        self.salaries = np.asarray(salaries, dtype=np.float64)
+        self.origin = (np.full(len(self.features), FROM_DATASET, dtype=np.int8) if origin is None
+                       else np.asarray(origin, dtype=np.int8))
+        self.tree_size = len(self.features)
+        self.tree = KDTree(self.predictor.transform(self.features), leaf_size=LEAF_SIZE)
+        self.source_hashes = {}
+        self.bundle_fingerprint = bundle_fingerprint(self.predictor)
+
+    def __len__(self):
+        return len(self.features)
+
+    @property
+    def delta_size(self):
+        return len(self.features) - self.tree_size
+
+    def rebuild(self):
+        """Rebuild the KD-tree over every stored student"""
+        self.tree = KDTree(self.predictor.transform(self.features), leaf_size=LEAF_SIZE)
+        self.tree_size = len(self.features)
+
+    def add_cohort(self, features, categories, salaries, origin=FROM_APPEND):
+        """
+        Append a new cohort; it is searchable immediately through the delta buffer
+        Returns True if the tree was rebuilt
+        """
+        features = np.asarray(features, dtype=np.float64).reshape(-1, len(FEATURE_COLUMNS))
+        self.features = np.vstack([self.features, features])
+        self.categories = np.concatenate([self.categories, np.asarray(categories, dtype=np.int64)])
+        self.salaries = np.concatenate([self.salaries, np.asarray(salaries, dtype=np.float64)])
+        self.origin = np.concatenate([self.origin, np.full(len(features), origin, dtype=np.int8)])
+        if self.delta_size > REBUILD_FRACTION * self.tree_size:
+            self.rebuild()
+            return True
+        return False
+
+    def query(self, X, k=5):
+        """
+        k nearest students for each row of raw features
+        Returns (distances, indices), both shaped (n_rows, k)
+        """
+        X_scaled = self.predictor.transform(X)
+        k_tree = min(k, self.tree_size)
+        dist, idx = self.tree.query(X_scaled, k=k_tree)
+        if self.delta_size == 0:
+            return dist, idx
+
+        # Brute force over the (small) delta buffer, then merge with the tree hits
+        delta_scaled = self.predictor.transform(self.features[self.tree_size:])
+        delta_dist = np.sqrt(((X_scaled[:, None, :] - delta_scaled[None, :, :]) ** 2).sum(axis=2))
+        all_dist = np.hstack([dist, delta_dist])
+        all_idx = np.hstack([idx, np.broadcast_to(np.arange(self.tree_size, len(self)), delta_dist.shape)])
+        order = np.argsort(all_dist, axis=1, kind='stable')[:, :k]
+        return np.take_along_axis(all_dist, order, axis=1), np.take_along_axis(all_idx, order, axis=1)
+
+    def appended_rows(self):
+        """(features, categories, salaries) of rows added with append_students()"""
+        mask = self.origin == FROM_APPEND
+        return self.features[mask], self.categories[mask], self.salaries[mask]
+
+    def sync_sources(self, features_path=FEATURES_PATH, outcomes_path=OUTCOMES_PATH):
+        """
+        Apply rows appended to the datasets since the index was built
+        Returns False if existing dataset rows changed (a full rebuild is needed)
+        """
+        features, categories, salaries = load_history(features_path, outcomes_path)
+        mask = self.origin == FROM_DATASET
+        n_indexed = int(mask.sum())
+        if len(features) < n_indexed:
+            return False
+        unchanged = (np.array_equal(features[:n_indexed], self.features[mask])
+                     and np.array_equal(categories[:n_indexed], self.categories[mask])
+                     and np.array_equal(salaries[:n_indexed], self.salaries[mask], equal_nan=True))
+        if not unchanged:
+            return False
+        if len(features) > n_indexed:
+            self.add_cohort(features[n_indexed:], categories[n_indexed:], salaries[n_indexed:], FROM_DATASET)
+        self.source_hashes = {features_path: file_sha256(features_path), outcomes_path: file_sha256(outcomes_path)}
+        return True
+
+    def similar_students(self, profile, k=5):
+        """
+        Most similar past students to one profile (dict keyed by FEATURE_COLUMNS)
+        Returns list of dicts with distance, outcome and key features
+        """
+        dist, idx = self.query(profile, k)
+        return [
+            {
+                'distance': round(float(d), 3),
+                'package_category': CLASS_MAP[int(self.categories[i])],
+                'salary': float(self.salaries[i]),
+                **{col: float(v) for col, v in zip(FEATURE_COLUMNS, self.features[i])},
+            }
+            for d, i in zip(dist[0], idx[0])
+        ]
+
+    def save(self, path=INDEX_PATH):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        state = {
+            'features': self.features,
+            'categories': self.categories,
+            'salaries': self.salaries,
+            'origin': self.origin,
+            'tree_size': self.tree_size,
+            'tree': self.tree,
+            'source_hashes': self.source_hashes,
+            'bundle_fingerprint': self.bundle_fingerprint,
+        }
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(state, f)
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path=INDEX_PATH, predictor=None):
+        with open(path, 'rb') as f:
+            state = pickle.load(f)
+        index = cls.__new__(cls)
+        index.predictor = predictor or get_predictor()
+        for key in ('features', 'categories', 'salaries', 'tree_size', 'tree', 'source_hashes'):
+            setattr(index, key, state[key])
+        index.origin = state.get('origin', np.full(len(index.features), FROM_DATASET, dtype=np.int8))
+        index.bundle_fingerprint = state.get('bundle_fingerprint')
+        return index
+
+
+def load_history(features_path=FEATURES_PATH, outcomes_path=OUTCOMES_PATH):
+    """Raw features, encoded outcome and salary for every historical student"""
+    df = load_or_convert(features_path, columns=FEATURE_COLUMNS + [TARGET_COLUMN], decode=False)
+    salaries = load_or_convert(outcomes_path, columns=['Salary'])['Salary'].to_numpy()
+    if len(salaries) != len(df):
+        raise ValueError(f"{features_path} and {outcomes_path} have different row counts")
+    return df[FEATURE_COLUMNS].to_numpy(dtype=np.float64), df[TARGET_COLUMN].to_numpy(), salaries
+
+
+def build_index(path=INDEX_PATH, features_path=FEATURES_PATH, outcomes_path=OUTCOMES_PATH, appended=None):
+    """
+    Build the index from the datasets and persist it
+    appended: (features, categories, salaries) of appended rows to carry over
+    """
+    features, categories, salaries = load_history(features_path, outcomes_path)
+    index = SimilarStudentsIndex(features, categories, salaries)
+    if appended is not None and len(appended[0]):
+        index.add_cohort(*appended)
+        index.rebuild()
+    index.source_hashes = {features_path: file_sha256(features_path), outcomes_path: file_sha256(outcomes_path)}
+    index.save(path)
+    print(f"✅ Indexed {len(index)} past students -> {path}")
+    return index
+
+
+def load_or_build(path=INDEX_PATH, features_path=FEATURES_PATH, outcomes_path=OUTCOMES_PATH):
+    """
+    Load the persisted index and bring it up to date:
+    rows appended to the datasets are added incrementally, a new model bundle
+    re-scales the tree, and only rewritten dataset rows force a full rebuild
+    """
+    if not Path(path).exists():
+        return build_index(path, features_path, outcomes_path)
+
+    index = SimilarStudentsIndex.load(path)
+    changed = False
+    current_bundle = bundle_fingerprint(index.predictor)
+    if index.bundle_fingerprint != current_bundle:
+        index.rebuild()
+        index.bundle_fingerprint = current_bundle
+        changed = True
+
+    sources_ok = all(index.source_hashes.get(p) == file_sha256(p) for p in (features_path, outcomes_path))
+    if not sources_ok:
+        if not index.sync_sources(features_path, outcomes_path):
+            return build_index(path, features_path, outcomes_path, appended=index.appended_rows())
+        changed = True
+
+    if changed:
+        index.save(path)
+    return index
+
+
+def append_students(features, categories, salaries, path=INDEX_PATH):
+    """
+    Add a new cohort of past students to the persisted index without a rebuild
+    features: rows in FEATURE_COLUMNS order; categories: encoded Package_Category
+    """
+    index = load_or_build(path)
+    rebuilt = index.add_cohort(features, categories, salaries)
+    index.save(path)
+    print(f"✅ Added {len(np.atleast_2d(features))} students ({'tree rebuilt' if rebuilt else 'delta buffer'}) -> {path}")
+    return index
+
+
+# Test function
+if __name__ == "__main__":
+    import sys
+    import time
+
+    index = build_index() if '--rebuild' in sys.argv else load_or_build()
+
+    student = dict(zip(FEATURE_COLUMNS, [82, 78, 8.1, 1, 1, 1, 3, 1, 55]))
+    index.similar_students(student)  # Warm-up
+    start = time.perf_counter()
+    neighbors = index.similar_students(student, k=5)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    print(f"🎓 5 most similar past students ({elapsed_ms:.3f} ms):")
+    for n in neighbors:
+        print(f"   CGPA {n['Cgpa']:.2f} | Skills {n['Technical_Skills_Score']:.0f} | "
+              f"{n['package_category']} | ₹{n['salary']} LPA | distance {n['distance']}")
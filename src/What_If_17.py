@@ -0,0 +1,156 @@
+"""
+What-If Analysis
+Answers "what would move me to Standard / Premium?" in one vectorized call:
+the grid of candidate profiles is built as a single NumPy array, scaled and
+scored with one predict_proba, and the smallest change that lands in each
+tier is returned. Change size is measured in scaler standard deviations
+"""
+
+import numpy as np
+
+from src.Model_Artifacts_12 import get_predictor
+from src.Records_09 import FEATURE_COLUMNS, PROFILE_FEATURES
+
+
+MAX_GRID_POINTS = 2_000_000
+
+# Placement tiers from lowest to highest
+TIER_ORDER = ['Not Placed', 'Basic', 'Standard', 'Premium']
+
+
+def _feature_name(key):
+    """Accept model feature names or parsed-profile keys"""
+    if key in FEATURE_COLUMNS:
+        return key
+    if key in PROFILE_FEATURES:
+        return PROFILE_FEATURES[key]
+    raise KeyError(f"Unknown feature: {key}")
+
+
+def _axis_values(spec):
+    """Range spec -> 1D array: (start, stop, step) tuple or any iterable of values"""
+    if isinstance(spec, tuple) and len(spec) == 3:
+        start, stop, step = spec
+        # Half-step margin so the stop value is included despite float steps
+        return np.round(np.arange(start, stop + step / 2, step), 6)
+    # Unique values, so [current, 1] for a flag already at 1 is a single point
+    return np.unique(np.asarray(list(spec), dtype=np.float64))
+
+
+def base_row(base_profile):
+    """Base profile as a feature row in FEATURE_COLUMNS order"""
+    values = {_feature_name(k): float(v) for k, v in base_profile.items()
+              if k in FEATURE_COLUMNS or k in PROFILE_FEATURES}
+    missing = [c for c in FEATURE_COLUMNS if c not in values]
+    if missing:
+        raise KeyError(f"Base profile is missing features: {missing}")
+    return np.array([values[c] for c in FEATURE_COLUMNS])
+
+
+def build_grid(base, ranges):
+    """
+    Every combination of the swept values on top of the base row
+    Returns grid matrix in FEATURE_COLUMNS order
+    """
+    swept = [(FEATURE_COLUMNS.index(_feature_name(k)), _axis_values(spec)) for k, spec in ranges.items()]
+    n_points = int(np.prod([len(values) for _, values in swept])) if swept else 1
+    if n_points > MAX_GRID_POINTS:
+        raise ValueError(f"Grid has {n_points} points, limit is {MAX_GRID_POINTS}; use coarser steps")
+
+    grid = np.tile(base, (n_points, 1))
+    if swept:
+        mesh = np.meshgrid(*[values for _, values in swept], indexing='ij')
+        for (col, _), axis in zip(swept, mesh):
+            grid[:, col] = axis.ravel()
+    return grid
+
+
+def what_if(base_profile, ranges, predictor=None):
+    """
+    Sweep the given feature ranges and find the minimal change reaching each tier
+    base_profile: dict of all model features (feature names or parsed-profile keys)
+    ranges: dict feature -> (start, stop, step) or list of values
+    Returns dict with the current tier and, per tier, the cheapest change found (or None)
+    """
+    predictor = predictor or get_predictor()
+    base = base_row(base_profile)
+    grid = build_grid(base, ranges)
+
+    # One vectorized scaler + model pass over the whole grid
+    base_proba = predictor.predict_proba(base[None, :])[0]
+    proba = predictor.predict_proba(grid)
+    predicted = predictor.classes[np.argmax(proba, axis=1)]
+
+    # Effort of each grid point: total change in standard deviations, then number of features touched
+    deltas = grid - base
+    changed = np.abs(deltas) > 1e-9
+    cost = (np.abs(deltas) / np.asarray(predictor.scale)).sum(axis=1)
+    n_changed = changed.sum(axis=1)
+
+    current_code = int(predictor.classes[np.argmax(base_proba)])
+    result = {
+        'current': predictor.class_map[current_code],
+        'probabilities': {predictor.class_map[int(c)]: round(float(p), 4) for c, p in zip(predictor.classes, base_proba)},
+        'grid_points': len(grid),
+        'boundaries': {},
+    }
+
+    for code, label in predictor.class_map.items():
+        if code == current_code:
+            continue
+        hits = np.flatnonzero(predicted == code)
+        if hits.size == 0:
+            result['boundaries'][label] = None
+            continue
+        # Lexicographic: least effort, then fewest features changed, then most confident
+        class_idx = int(np.flatnonzero(predictor.classes == code)[0])
+        order = np.lexsort((-proba[hits, class_idx], n_changed[hits], np.round(cost[hits], 9)))
+        best = hits[order[0]]
+        result['boundaries'][label] = {
+            'changes': {
+                FEATURE_COLUMNS[col]: {'from': float(base[col]), 'to': float(grid[best, col])}
+                for col in np.flatnonzero(changed[best])
+            },
+            'probability': round(float(proba[best, class_idx]), 4),
+            'effort': round(float(cost[best]), 3),
+        }
+    return result
+
+
+def next_tier_changes(result):
+    """Boundaries for tiers above the current one, lowest tier first"""
+    current_rank = TIER_ORDER.index(result['current'])
+    return {
+        tier: result['boundaries'].get(tier)
+        for tier in TIER_ORDER[current_rank + 1:]
+    }
+
+
+# Test function
+if __name__ == "__main__":
+    student = {
+        'tenth_marks': 78,
+        'twelfth_marks': 74,
+        'cgpa': 7.2,
+        'internships': 0,
+        'training': 1,
+        'projects': 1,
+        'communication_level': 3,
+        'technical_course': 0,
+        'technical_skills_score': 45,
+    }
+    ranges = {
+        'cgpa': (7.2, 10.0, 0.1),
+        'technical_skills_score': (45, 100, 5),
+        'internships': [student['internships'], 1],
+        'technical_course': [student['technical_course'], 1],
+    }
+
+    result = what_if(student, ranges)
+    print(f"🎯 Current prediction: {result['current']} ({result['grid_points']} what-if profiles scored)")
+    for tier, change in next_tier_changes(result).items():
+        if change is None:
+            print(f"   {tier}: not reachable within these ranges")
+            continue
+        steps = ', '.join(f"{f}: {c['from']:g} → {c['to']:g}" for f, c in change['changes'].items())
+        print(f"   {tier}: {steps} ({change['probability']:.0%} confidence)")